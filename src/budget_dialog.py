@@ -1,12 +1,215 @@
 from __future__ import annotations
 
+import contextlib
+import functools
+import math
+
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from . import logic
-from .translate import tr
+from .translate import MONTH_NUMBERS, tr
+
+
+def _to_cents(amount: float) -> int:
+	# inf/nan (ex: "1e400", ou 1e307 une fois en centimes) ne sont pas des montants:
+	# refusés comme une saisie invalide.
+	cents = amount * 100
+	if not math.isfinite(cents):
+		raise ValueError("Prix invalide")
+	return int(round(cents))
+
+
+def _initial_cents(amount: float) -> int:
+	# Budget lu depuis budgets.json: une valeur non finie (inf/nan saisis à la main),
+	# refusée à la saisie, vaut 0 comme toute valeur illisible dans load_budgets.
+	try:
+		return _to_cents(float(amount or 0.0))
+	except (ValueError, TypeError, OverflowError):
+		return 0
+
+
+# Erreurs possibles à l'analyse d'une saisie de montant ("abc", "1/0", "1e400"...).
+_AMOUNT_ERRORS = (ValueError, ZeroDivisionError, OverflowError)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_amount(cents: int) -> str:
+	# Les mêmes montants sont repeints sans cesse: on garde leur texte en cache.
+	sign = "-" if cents < 0 else ""
+	units, rest = divmod(abs(cents), 100)
+	return f"{sign}{units}.{rest:02d}"
+
+
+# Alignement des montants, renvoyé par le modèle pour toutes les cellules budget.
+_AMOUNT_ALIGNMENT = QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+
+# Plage de cellules (top, left, bottom, right), bornes incluses.
+CellRange = tuple[int, int, int, int]
+
+
+class BudgetModel(QtCore.QAbstractTableModel):
+	"""Budgets d'une année: 12 lignes (mois) x (1 + N) colonnes (mois, catégories).
+
+	Les montants sont stockés en centimes (int, arithmétique exacte) dans
+	_data[mois][catégorie] (None = pas de budget); la conversion en float ne se fait
+	qu'à la sortie (budgets()). Qt n'interroge data() que pour les cellules visibles.
+	"""
+
+	def __init__(
+		self,
+		month_names: list[str],
+		categories: list[str],
+		initial_budgets: dict[str, dict[str, float]],
+		parent: QtCore.QObject | None = None,
+	):
+		super().__init__(parent)
+		self._month_names = list(month_names)
+		self._categories = list(categories)
+		self._data: list[list[int | None]] = []
+		for m in range(12):
+			per_cat = initial_budgets.get(MONTH_NUMBERS[m], {})
+			self._data.append(
+				[
+					_initial_cents(per_cat[cat]) if cat in per_cat else None
+					for cat in self._categories
+				]
+			)
+
+	def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._data)
+
+	def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+		return 0 if parent.isValid() else 1 + len(self._categories)
+
+	def headerData(self, section: int, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+		if role != QtCore.Qt.ItemDataRole.DisplayRole:
+			return None
+		if orientation == QtCore.Qt.Orientation.Horizontal:
+			return "Mois" if section == 0 else self._categories[section - 1]
+		return str(section + 1)
+
+	def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.ItemDataRole.DisplayRole):
+		if not index.isValid():
+			return None
+		row, col = index.row(), index.column()
+		if col == 0:
+			if role == QtCore.Qt.ItemDataRole.DisplayRole:
+				return self._month_names[row]
+			return None
+
+		if role == QtCore.Qt.ItemDataRole.DisplayRole:
+			# Valeur brute: le formatage est fait par BudgetDelegate, seulement pour les cellules peintes.
+			return self._data[row][col - 1]
+		if role == QtCore.Qt.ItemDataRole.EditRole:
+			value = self._data[row][col - 1]
+			return "" if value is None else _format_amount(value)
+		if role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
+			return _AMOUNT_ALIGNMENT
+		return None
+
+	def setData(self, index: QtCore.QModelIndex, value, role=QtCore.Qt.ItemDataRole.EditRole) -> bool:
+		if role != QtCore.Qt.ItemDataRole.EditRole or not index.isValid() or index.column() < 1:
+			return False
+		text = str(value if value is not None else "").strip()
+		try:
+			amount = None if text == "" else _to_cents(logic.parse_price_to_float(text))
+		except _AMOUNT_ERRORS:
+			return False
+		self._data[index.row()][index.column() - 1] = amount
+		self.dataChanged.emit(index, index)
+		return True
+
+	def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
+		if not index.isValid():
+			return QtCore.Qt.ItemFlag.NoItemFlags
+		flags = QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+		if index.column() >= 1:
+			flags |= QtCore.Qt.ItemFlag.ItemIsEditable
+		return flags
+
+	def set_values(self, ranges: list[CellRange], value: int | None) -> None:
+		"""Écrit la même valeur dans des plages (top, left, bottom, right) avec un seul dataChanged."""
+
+		ranges = [(t, max(1, l), b, r) for t, l, b, r in ranges if r >= 1]
+		if not ranges:
+			return
+		for top, left, bottom, right in ranges:
+			for row in range(top, bottom + 1):
+				values = self._data[row]
+				for col in range(left - 1, right):
+					values[col] = value
+		self._emit_changed(
+			min(t for t, _l, _b, _r in ranges),
+			min(l for _t, l, _b, _r in ranges),
+			max(b for _t, _l, b, _r in ranges),
+			max(r for _t, _l, _b, r in ranges),
+		)
+
+	def set_rows(self, spans: list[tuple[int, int]], values: list[int | None]) -> None:
+		"""Remplace les montants des lignes (mois) des plages (top, bottom) avec un seul dataChanged."""
+
+		if not spans:
+			return
+		for top, bottom in spans:
+			for r in range(top, bottom + 1):
+				self._data[r] = list(values)
+		self._emit_changed(
+			min(top for top, _bottom in spans),
+			1,
+			max(bottom for _top, bottom in spans),
+			len(self._categories),
+		)
+
+	def _emit_changed(self, top: int, left: int, bottom: int, right: int) -> None:
+		self.dataChanged.emit(
+			self.index(top, left),
+			self.index(bottom, right),
+			[QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.EditRole],
+		)
+
+	def value(self, row: int, col: int) -> int | None:
+		"""Montant de la cellule (col>=1) en centimes, None si vide."""
+		return self._data[row][col - 1]
+
+	def row_values(self, row: int) -> list[int | None]:
+		"""Copie des montants d'un mois en centimes (une valeur par catégorie)."""
+		return list(self._data[row])
+
+	def all_values(self) -> list[list[int | None]]:
+		"""Montants des 12 mois en centimes, lus directement sans passer par des QModelIndex.
+
+		Le résultat partage les listes internes: à utiliser en lecture seule.
+		"""
+		return self._data
+
+
+class BudgetDelegate(QtWidgets.QStyledItemDelegate):
+	"""Affiche les montants bruts du modèle au format 0.00 (vide si pas de budget)."""
+
+	def displayText(self, value, locale) -> str:
+		if isinstance(value, int):
+			return _format_amount(value)
+		if value is None:
+			return ""
+		return super().displayText(value, locale)
+
+
+class BudgetTableView(QtWidgets.QTableView):
+	"""Table des budgets: largeur de colonne calculée une fois, sans mesurer chaque cellule."""
+
+	def __init__(self, parent: QtWidgets.QWidget | None = None):
+		super().__init__(parent)
+		self._column_width = self.fontMetrics().horizontalAdvance("999999.99") + 16
+
+	def sizeHintForColumn(self, column: int) -> int:
+		return self._column_width
 
 
 class BudgetDialog(QtWidgets.QDialog):
+	# Ctrl+Entrée (clavier principal et pavé numérique), construits à partir des codes
+	# de touches, sans analyse de texte, à la première ouverture (QApplication créée).
+	_APPLY_KEYS: tuple[QtGui.QKeySequence, ...] | None = None
+
 	def __init__(
 		self,
 		*,
@@ -32,9 +235,19 @@ class BudgetDialog(QtWidgets.QDialog):
 		info.setStyleSheet("color: #555;")
 		layout.addWidget(info)
 
-		self.table = QtWidgets.QTableWidget(12, 1 + len(self._categories))
-		headers = ["Mois", *self._categories]
-		self.table.setHorizontalHeaderLabels(headers)
+		# Le modèle est rempli entièrement avant d'être attaché à la vue: aucune
+		# insertion ni signal par cellule, la vue ne fait qu'une mise en page initiale.
+		self._model = BudgetModel(self._month_names, self._categories, self._initial, self)
+		self.table = BudgetTableView()
+		self.table.setModel(self._model)
+		self.table.setItemDelegate(BudgetDelegate(self.table))
+		# 12 lignes d'une seule ligne de texte: hauteur fixe, pas de mesure du contenu.
+		vheader = self.table.verticalHeader()
+		vheader.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+		vheader.setDefaultSectionSize(24)
+		hheader = self.table.horizontalHeader()
+		hheader.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Interactive)
+		hheader.setDefaultSectionSize(self.table.sizeHintForColumn(0))
 		self.table.horizontalHeader().setStretchLastSection(True)
 		self.table.verticalHeader().setVisible(False)
 		self.table.setAlternatingRowColors(True)
@@ -67,25 +280,6 @@ class BudgetDialog(QtWidgets.QDialog):
 		self.apply_button.clicked.connect(self._apply_to_selection)
 		actions.addWidget(self.apply_button)
 
-		for m in range(12):
-			self.table.setItem(m, 0, QtWidgets.QTableWidgetItem(self._month_names[m]))
-
-		for m in range(12):
-			month_key = f"{m + 1:02d}"
-			per_cat = self._initial.get(month_key, {})
-			for ci, cat in enumerate(self._categories, start=1):
-				if cat in per_cat:
-					val = float(per_cat.get(cat, 0.0) or 0.0)
-					text = f"{val:.2f}"
-				else:
-					text = ""
-				item = QtWidgets.QTableWidgetItem(text)
-				item.setTextAlignment(
-					QtCore.Qt.AlignmentFlag.AlignRight
-					| QtCore.Qt.AlignmentFlag.AlignVCenter
-				)
-				self.table.setItem(m, ci, item)
-
 		buttons = QtWidgets.QDialogButtonBox(
 			QtWidgets.QDialogButtonBox.StandardButton.Cancel
 			| QtWidgets.QDialogButtonBox.StandardButton.Ok
@@ -94,60 +288,71 @@ class BudgetDialog(QtWidgets.QDialog):
 		buttons.rejected.connect(self.reject)
 		layout.addWidget(buttons)
 
-		self._shortcut_apply = QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Return"), self)
+		# Un seul raccourci pour Entrée (clavier principal) et Entrée du pavé numérique.
+		apply_keys = BudgetDialog._APPLY_KEYS
+		if apply_keys is None:
+			apply_keys = BudgetDialog._APPLY_KEYS = (
+				QtGui.QKeySequence(QtCore.Qt.KeyboardModifier.ControlModifier | QtCore.Qt.Key.Key_Return),
+				QtGui.QKeySequence(QtCore.Qt.KeyboardModifier.ControlModifier | QtCore.Qt.Key.Key_Enter),
+			)
+		self._shortcut_apply = QtGui.QShortcut(self)
+		self._shortcut_apply.setKeys(list(apply_keys))
 		self._shortcut_apply.activated.connect(self._apply_current_to_selection)
-		self._shortcut_apply2 = QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Enter"), self)
-		self._shortcut_apply2.activated.connect(self._apply_current_to_selection)
 
-		self._copied_row: list[str] | None = None
+		self._copied_row: list[int | None] | None = None
 
 	def budgets(self) -> dict[str, dict[str, float]]:
 		"""Retourne {"01": {"Nourriture": 200.0, ...}, ...}."""
 
-		result: dict[str, dict[str, float]] = {}
-		for m in range(12):
-			month_key = f"{m + 1:02d}"
-			per_cat: dict[str, float] = {}
-			for ci, cat in enumerate(self._categories, start=1):
-				item = self.table.item(m, ci)
-				text = item.text().strip() if item else ""
-				if text == "":
-					continue
-				value = float(logic.parse_price_to_float(text))
-				per_cat[cat] = value
-			if per_cat:
-				result[month_key] = per_cat
-		return result
-
-	def _selected_budget_indexes(self) -> list[QtCore.QModelIndex]:
-		"""Retourne les indexes sélectionnés qui correspondent aux cellules budget (col>=1)."""
-		indexes = self.table.selectionModel().selectedIndexes() if self.table.selectionModel() else []
-		return [i for i in indexes if i.column() >= 1]
-
-	def _apply_value_to_indexes(self, value_text: str, indexes: list[QtCore.QModelIndex]) -> None:
-		text = (value_text or "").strip()
-		if text == "":
-			# Effacer
-			for idx in indexes:
-				item = self.table.item(idx.row(), idx.column())
-				if item is None:
-					item = QtWidgets.QTableWidgetItem("")
-					self.table.setItem(idx.row(), idx.column(), item)
-				item.setText("")
-			return
+		categories = self._categories
+		return {
+			month_key: per_cat
+			for month_key, values in zip(MONTH_NUMBERS, self._model.all_values())
+			if (
+				per_cat := {
+					cat: cents / 100 for cat, cents in zip(categories, values) if cents is not None
+				}
+			)
+		}
+
+	@contextlib.contextmanager
+	def _batched_update(self):
+		"""Suspend le rendu de la table pendant une modification groupée, puis un seul repaint.
 
-		value = float(logic.parse_price_to_float(text))
-		display = f"{value:.2f}"
-		for idx in indexes:
-			item = self.table.item(idx.row(), idx.column())
-			if item is None:
-				item = QtWidgets.QTableWidgetItem()
-				self.table.setItem(idx.row(), idx.column(), item)
-			item.setText(display)
+		Les signaux ne sont pas bloqués: le modèle n'émet qu'un dataChanged par lot
+		et la vue en a besoin pour se mettre à jour.
+		"""
+		self.table.setUpdatesEnabled(False)
+		try:
+			yield
+		finally:
+			self.table.setUpdatesEnabled(True)
+			self.table.viewport().update()
+
+	def _selected_budget_ranges(self) -> list[CellRange]:
+		"""Retourne les plages sélectionnées limitées aux cellules budget (col>=1)."""
+		selection_model = self.table.selectionModel()
+		if selection_model is None:
+			return []
+		return [
+			(rng.top(), max(1, rng.left()), rng.bottom(), rng.right())
+			for rng in selection_model.selection()
+			if rng.right() >= 1
+		]
+
+	def _apply_value_to_ranges(self, value_text: str, ranges: list[CellRange]) -> None:
+		text = (value_text or "").strip()
+		# Texte vide = effacer; sinon validation (lève ValueError) une seule fois.
+		try:
+			value = None if text == "" else _to_cents(logic.parse_price_to_float(text))
+		except (ZeroDivisionError, OverflowError) as exc:
+			raise ValueError("Prix invalide") from exc
+		with self._batched_update():
+			self._model.set_values(ranges, value)
 
 	def _apply_to_selection(self) -> None:
-		indexes = self._selected_budget_indexes()
-		if not indexes:
+		ranges = self._selected_budget_ranges()
+		if not ranges:
 			QtWidgets.QMessageBox.information(
 				self,
 				tr("dialog.budget"),
@@ -163,14 +368,13 @@ class BudgetDialog(QtWidgets.QDialog):
 		if not ok:
 			return
 		try:
-			self._apply_value_to_indexes(text, indexes)
+			self._apply_value_to_ranges(text, ranges)
 		except ValueError as exc:
 			QtWidgets.QMessageBox.warning(self, tr("dialog.error"), str(exc))
 
 	def _apply_to_year(self) -> None:
 		# Applique une valeur sur 12 mois pour les colonnes (catégories) sélectionnées.
-		indexes = self._selected_budget_indexes()
-		cols = {i.column() for i in indexes}
+		cols = {c for _t, l, _b, r in self._selected_budget_ranges() for c in range(l, r + 1)}
 		if not cols:
 			current = self.table.currentIndex()
 			if current.isValid() and current.column() >= 1:
@@ -191,56 +395,45 @@ class BudgetDialog(QtWidgets.QDialog):
 		if not ok:
 			return
 
-		all_indexes: list[QtCore.QModelIndex] = []
-		for row in range(12):
-			for col in cols:
-				all_indexes.append(self.table.model().index(row, col))
 		try:
-			self._apply_value_to_indexes(text, all_indexes)
+			self._apply_value_to_ranges(text, [(0, col, 11, col) for col in sorted(cols)])
 		except ValueError as exc:
 			QtWidgets.QMessageBox.warning(self, tr("dialog.error"), str(exc))
 
 	def _copy_row(self) -> None:
-		row = self.table.currentRow()
+		row = self.table.currentIndex().row()
 		if row < 0:
 			return
-		values: list[str] = []
-		for ci in range(1, 1 + len(self._categories)):
-			item = self.table.item(row, ci)
-			values.append(item.text() if item else "")
-		self._copied_row = values
+		self._copied_row = self._model.row_values(row)
 		self.paste_row_button.setEnabled(True)
 
 	def _paste_row_to_selected_rows(self) -> None:
 		if not self._copied_row:
 			return
-		indexes = self.table.selectionModel().selectedIndexes() if self.table.selectionModel() else []
-		rows = sorted({i.row() for i in indexes if 0 <= i.row() < 12})
-		if not rows:
-			row = self.table.currentRow()
-			if 0 <= row < 12:
-				rows = [row]
-		if not rows:
+		selection_model = self.table.selectionModel()
+		selection = selection_model.selection() if selection_model else []
+		# Une plage par bloc sélectionné; les lignes couvertes deux fois sont
+		# simplement réécrites avec la même valeur.
+		spans = [(rng.top(), rng.bottom()) for rng in selection]
+		if not spans:
+			row = self.table.currentIndex().row()
+			if row >= 0:
+				spans = [(row, row)]
+		if not spans:
 			return
 
-		for r in rows:
-			for offset, text in enumerate(self._copied_row, start=1):
-				item = self.table.item(r, offset)
-				if item is None:
-					item = QtWidgets.QTableWidgetItem()
-					self.table.setItem(r, offset, item)
-				item.setText(text)
+		with self._batched_update():
+			self._model.set_rows(spans, self._copied_row)
 
 	def _apply_current_to_selection(self) -> None:
-		indexes = self._selected_budget_indexes()
-		if not indexes:
+		ranges = self._selected_budget_ranges()
+		if not ranges:
 			return
 		current = self.table.currentIndex()
 		if not current.isValid() or current.column() < 1:
 			return
-		item = self.table.item(current.row(), current.column())
-		text = item.text().strip() if item else ""
-		try:
-			self._apply_value_to_indexes(text, [i for i in indexes if i != current])
-		except ValueError as exc:
-			QtWidgets.QMessageBox.warning(self, tr("dialog.error"), str(exc))
+		# La cellule courante fait partie de la sélection: la réécrire avec sa
+		# propre valeur est sans effet, inutile de découper les plages.
+		value = self._model.value(current.row(), current.column())
+		with self._batched_update():
+			self._model.set_values(ranges, value)
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 import csv
+import functools
+import io
 import json
+import mmap
 import ast
-import uuid
 import os
 import shutil
 import re
+import tempfile
 from datetime import date, datetime
 from pathlib import Path
 
 
+# Encodeur partagé (même sortie que json.dumps(..., ensure_ascii=False, indent=2))
+# pour ne pas reconstruire un JSONEncoder à chaque écriture.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _as_path(path: Path | str) -> Path:
+    """Évite de reconstruire un Path quand l'appelant en fournit déjà un."""
+
+    return path if isinstance(path, Path) else Path(path)
+
+
 def get_data_dir(app_folder_name: str = "accountManager") -> Path:
     """Retourne le dossier de données de l'app.
 
@@ -65,7 +79,7 @@ def migrate_legacy_project_data(project_save_dir: Path, *, app_folder_name: str
 def load_app_settings(data_dir: Path) -> dict:
     """Charge les settings de l'app depuis settings.json (dans data_dir)."""
 
-    data_dir = Path(data_dir)
+    data_dir = _as_path(data_dir)
     path = data_dir / "settings.json"
     if not path.exists():
         return {}
@@ -77,11 +91,11 @@ def load_app_settings(data_dir: Path) -> dict:
 
 
 def save_app_settings(data_dir: Path, settings: dict) -> None:
-    data_dir = Path(data_dir)
+    data_dir = _as_path(data_dir)
     data_dir.mkdir(parents=True, exist_ok=True)
     path = data_dir / "settings.json"
     payload = settings if isinstance(settings, dict) else {}
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_text(_JSON_ENCODER.encode(payload), encoding="utf-8")
 
 
 def get_language_setting(data_dir: Path, *, default: str = "fr") -> str:
@@ -105,8 +119,8 @@ def backup_expenses_daily(csv_path: Path) -> Path | None:
     Retourne le chemin du backup si effectué.
     """
 
-    csv_path = Path(csv_path)
-    if not csv_path.exists() or not csv_path.is_file():
+    csv_path = _as_path(csv_path)
+    if not os.path.isfile(csv_path):
         return None
 
     backup_path = csv_path.parent / f"{date.today().isoformat()}.csv"
@@ -121,6 +135,116 @@ class DuplicateExpenseError(ValueError):
     pass
 
 
+# Imbrication maximale (parenthèses et signes unaires) d'une expression de prix,
+# sous la limite de l'ancienne analyse via ast (200) et loin de la pile Python.
+_MAX_PRICE_NESTING = 100
+
+# Jetons d'une expression de prix: nombre (12, 12.5, .5, 1e3) ou opérateur.
+_PRICE_TOKEN_RE = re.compile(
+    r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([-+*/()]))"
+)
+
+
+def _tokenize_price(expr: str) -> list[tuple[str, float | str]] | None:
+    """Découpe une expression en jetons ("num", valeur) / ("op", symbole).
+
+    Retourne None si un caractère inconnu est rencontré.
+    Lève ValueError pour un entier à zéro initial.
+    """
+
+    tokens: list[tuple[str, float | str]] = []
+    pos = 0
+    length = len(expr)
+    while pos < length:
+        match = _PRICE_TOKEN_RE.match(expr, pos)
+        if match is None:
+            if expr[pos:].isspace():
+                break
+            return None
+        number, op = match.groups()
+        if number is not None:
+            # Comme Python (ast): entier à zéro initial interdit ("05"), "00" permis.
+            if number[0] == "0" and number.isdigit() and number.strip("0"):
+                raise ValueError("Prix invalide")
+            tokens.append(("num", float(number)))
+        else:
+            tokens.append(("op", op))
+        pos = match.end()
+    return tokens
+
+
+def _eval_price_tokens(tokens: list[tuple[str, float | str]]) -> float:
+    """Analyseur descendant récursif: expr := term (+|- term)*, term := factor (*|/ factor)*."""
+
+    index = 0
+    count = len(tokens)
+    # Division par zéro signalée seulement si l'expression entière est valide:
+    # une expression mal formée reste une ValueError, comme avec ast.
+    zero_division = False
+
+    def _next_op() -> float | str | None:
+        if index < count and tokens[index][0] == "op":
+            return tokens[index][1]
+        return None
+
+    def _expr() -> float:
+        nonlocal index
+        value = _term()
+        while (op := _next_op()) in ("+", "-"):
+            index += 1
+            right = _term()
+            value = value + right if op == "+" else value - right
+        return value
+
+    def _term() -> float:
+        nonlocal index, zero_division
+        value = _factor()
+        while (op := _next_op()) in ("*", "/"):
+            index += 1
+            right = _factor()
+            if op == "*":
+                value = value * right
+            elif right:
+                value = value / right
+            else:
+                zero_division = True
+        return value
+
+    depth = 0
+
+    def _factor() -> float:
+        nonlocal index, depth
+        if index >= count:
+            raise ValueError("Prix invalide")
+        kind, token = tokens[index]
+        index += 1
+        if kind == "num":
+            return float(token)
+        if token not in ("+", "-", "("):
+            raise ValueError("Prix invalide")
+        depth += 1
+        if depth > _MAX_PRICE_NESTING:
+            raise ValueError("Prix invalide")
+        if token == "(":
+            value = _expr()
+            if _next_op() != ")":
+                raise ValueError("Prix invalide")
+            index += 1
+        else:
+            value = _factor()
+            if token == "-":
+                value = -value
+        depth -= 1
+        return value
+
+    result = _expr()
+    if index != count:
+        raise ValueError("Prix invalide")
+    if zero_division:
+        raise ZeroDivisionError("float division by zero")
+    return result
+
+
 def _eval_arithmetic_expression(expr: str) -> float:
     """Évalue une expression arithmétique simple en toute sécurité.
 
@@ -132,6 +256,15 @@ def _eval_arithmetic_expression(expr: str) -> float:
     if not expr:
         raise ValueError("Prix invalide")
 
+    tokens = _tokenize_price(expr)
+    if tokens is not None:
+        return _eval_price_tokens(tokens)
+
+    # Caractère inattendu (ex: littéral Python 1_000): repli sur l'analyse via ast.
+    return _eval_ast_expression(expr)
+
+
+def _eval_ast_expression(expr: str) -> float:
     try:
         node = ast.parse(expr, mode="eval")
     except SyntaxError as exc:
@@ -168,15 +301,23 @@ def _eval_arithmetic_expression(expr: str) -> float:
     return _eval(node)
 
 
+# Virgule décimale -> point, espaces (séparateurs de milliers) supprimés, en une passe.
+_PRICE_TRANS = str.maketrans({",": ".", " ": None})
+
+
 def parse_price_to_float(price: str) -> float:
-    value = (price or "").strip().replace(",", ".")
+    value = (price or "").translate(_PRICE_TRANS).strip()
     if value == "":
         return 0.0
-    value = value.replace(" ", "")
     try:
         return float(value)
     except ValueError:
-        return float(_eval_arithmetic_expression(value))
+        pass
+    try:
+        return _eval_arithmetic_expression(value)
+    except RecursionError as exc:
+        # Filet de sécurité (ex: repli ast sur une saisie très imbriquée).
+        raise ValueError("Prix invalide") from exc
 
 
 def format_price(price: str) -> str:
@@ -244,8 +385,8 @@ def load_budgets(budgets_path: Path) -> dict[str, dict[str, dict[str, float]]]:
     }
     """
 
-    budgets_path = Path(budgets_path)
-    if not budgets_path.exists():
+    budgets_path = _as_path(budgets_path)
+    if not os.path.exists(budgets_path):
         return {}
 
     try:
@@ -278,10 +419,10 @@ def load_budgets(budgets_path: Path) -> dict[str, dict[str, dict[str, float]]]:
 
 
 def save_budgets(budgets_path: Path, budgets: dict[str, dict[str, dict[str, float]]]) -> None:
-    budgets_path = Path(budgets_path)
+    budgets_path = _as_path(budgets_path)
     budgets_path.parent.mkdir(parents=True, exist_ok=True)
     budgets_path.write_text(
-        json.dumps(budgets, ensure_ascii=False, indent=2), encoding="utf-8"
+        _JSON_ENCODER.encode(budgets), encoding="utf-8"
     )
 
 
@@ -309,53 +450,139 @@ DEFAULT_CATEGORY_COLORS: dict[str, str] = {
 }
 
 
+_HEX_COLOR_RE = re.compile(r"#(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})")
+
+
 def _normalize_hex_color(color: str | None) -> str:
     if not isinstance(color, str):
         return ""
+    return _normalize_hex_text(color)
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_hex_text(color: str) -> str:
+    # très léger contrôle: "#" suivi de 3 ou 6 chars hexa
     value = color.strip()
-    if not value:
-        return ""
-    if not value.startswith("#"):
-        return ""
-    if len(value) not in (4, 7):
-        return ""
-    # très léger contrôle: tous les chars doivent être hexa
-    hex_part = value[1:]
-    if any(ch not in "0123456789abcdefABCDEF" for ch in hex_part):
-        return ""
-    return value
+    return value if _HEX_COLOR_RE.fullmatch(value) else ""
 
 
-def load_category_options(options_path: Path) -> tuple[list[str], dict[str, str]]:
-    """Charge les catégories et leurs couleurs depuis qt_options.json.
+def _default_category_options() -> tuple[list[str], dict[str, str]]:
+    categories = list(DEFAULT_CATEGORIES)
+    colors = {c: DEFAULT_CATEGORY_COLORS.get(c, "") for c in categories}
+    return categories, colors
 
-    Format supporté (actuel):
-      {"categories": [{"name": "Nourriture", "color": "#FFC0CB"}, ...]}
 
-    Migration automatique depuis l'ancien format:
-      {"categories": ["Nourriture", ...]}
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class CategoryStore:
+    """État en mémoire de qt_options.json pour un chemin donné.
+
+    Le fichier n'est relu que si (mtime, taille) a changé depuis la dernière
+    lecture/écriture; chaque mutation se traduit par une seule écriture.
+    Les lectures renvoient toujours des copies que l'appelant peut modifier.
     """
 
-    options_path = Path(options_path)
-    if not options_path.exists():
-        categories = list(DEFAULT_CATEGORIES)
-        colors = {c: DEFAULT_CATEGORY_COLORS.get(c, "") for c in categories}
-        save_category_options(options_path, categories, colors)
-        return categories, colors
+    __slots__ = ("path", "categories", "colors", "_stamp")
 
-    try:
-        data = json.loads(options_path.read_text(encoding="utf-8"))
-    except Exception:
-        categories = list(DEFAULT_CATEGORIES)
-        colors = {c: DEFAULT_CATEGORY_COLORS.get(c, "") for c in categories}
-        save_category_options(options_path, categories, colors)
-        return categories, colors
+    def __init__(self, path: Path):
+        self.path = _as_path(path)
+        self.categories: list[str] = []
+        self.colors: dict[str, str] = {}
+        # Empreinte du fichier quand l'état mémoire lui correspond (normalisé).
+        self._stamp: tuple[int, int] | None = None
+
+    def _ensure(self) -> bool:
+        """Recharge depuis le disque si nécessaire; retourne True si le contenu doit être persisté."""
 
+        stamp = _file_stamp(self.path)
+        if stamp is not None and stamp == self._stamp:
+            return False
+
+        if stamp is None:
+            categories, colors = _default_category_options()
+            dirty = True
+        else:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception:
+                categories, colors = _default_category_options()
+                dirty = True
+            else:
+                categories, colors, dirty = _parse_category_options(data)
+
+        self.categories, self.colors = categories, colors
+        self._stamp = None if dirty else stamp
+        return dirty
+
+    def snapshot(self) -> tuple[list[str], dict[str, str], bool]:
+        """Retourne (categories, colors, dirty) sans jamais écrire le fichier."""
+
+        dirty = self._ensure()
+        return list(self.categories), dict(self.colors), dirty
+
+    def replace(self, categories: list[str], colors: dict[str, str]) -> None:
+        # Couleurs normalisées une seule fois, réutilisées pour le JSON et l'état mémoire.
+        self.categories = list(categories)
+        self.colors = {name: _normalize_hex_color(colors.get(name)) for name in categories}
+        self.save()
+
+    def add(self, name: str) -> list[str]:
+        name = name.strip()
+        if not name:
+            raise ValueError("Le nom de catégorie est obligatoire")
+
+        self._ensure()
+        if name.casefold() in {c.casefold() for c in self.categories}:
+            raise ValueError("Cette catégorie existe déjà")
+
+        self.categories.append(name)
+        self.colors[name] = _normalize_hex_color(DEFAULT_CATEGORY_COLORS.get(name))
+        self.save()
+        return list(self.categories)
+
+    def remove(self, name: str) -> list[str]:
+        name = name.strip()
+        if not name:
+            raise ValueError("La catégorie à supprimer est invalide")
+
+        self._ensure()
+        target = name.casefold()
+        remaining = [c for c in self.categories if c.casefold() != target]
+        if len(remaining) == len(self.categories):
+            raise ValueError("Catégorie introuvable")
+
+        self.categories = remaining
+        self.colors = {c: self.colors.get(c, "") for c in remaining}
+        self.save()
+        return list(remaining)
+
+    def save(self) -> None:
+        # Si l'écriture échoue, la prochaine lecture repartira du disque.
+        self._stamp = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            _JSON_ENCODER.encode(_category_payload(self.categories, self.colors)),
+            encoding="utf-8",
+        )
+        # Le contenu écrit est connu: inutile de le relire tant que le fichier ne change pas.
+        stamp = _file_stamp(self.path)
+        self._stamp = stamp if _is_normalized(self.categories, self.colors) else None
+
+
+@functools.lru_cache(maxsize=4)
+def _store(options_path: str) -> CategoryStore:
+    return CategoryStore(Path(options_path))
+
+
+def _parse_category_options(data: object) -> tuple[list[str], dict[str, str], bool]:
     if not isinstance(data, dict):
-        categories = list(DEFAULT_CATEGORIES)
-        colors = {c: DEFAULT_CATEGORY_COLORS.get(c, "") for c in categories}
-        save_category_options(options_path, categories, colors)
-        return categories, colors
+        return (*_default_category_options(), True)
 
     raw_categories = data.get("categories")
     categories: list[str] = []
@@ -377,63 +604,91 @@ def load_category_options(options_path: Path) -> tuple[list[str], dict[str, str]
             categories.append(value)
             colors[value] = DEFAULT_CATEGORY_COLORS.get(value, "")
         if not categories:
-            categories = list(DEFAULT_CATEGORIES)
-            colors = {c: DEFAULT_CATEGORY_COLORS.get(c, "") for c in categories}
-
-        save_category_options(options_path, categories, colors)
-        return categories, colors
+            categories, colors = _default_category_options()
+        return categories, colors, True
 
     # Nouveau format: liste d'objets {name,color}
+    # dirty passe à True dès qu'une normalisation modifie le contenu (clé inconnue,
+    # élément ignoré, nom rogné, doublon, couleur corrigée ou par défaut).
+    dirty = len(data) != 1
     if isinstance(raw_categories, list):
         for item in raw_categories:
             if not isinstance(item, dict):
+                dirty = True
                 continue
             name = item.get("name")
             if not isinstance(name, str):
+                dirty = True
                 continue
             value = name.strip()
             if not value:
+                dirty = True
                 continue
 
             key = value.casefold()
             if key in seen:
+                dirty = True
                 continue
             seen.add(key)
 
-            color = _normalize_hex_color(item.get("color"))
+            raw_color = item.get("color")
+            color = _normalize_hex_color(raw_color)
             if not color:
-                color = DEFAULT_CATEGORY_COLORS.get(value, "")
+                color = _normalize_hex_color(DEFAULT_CATEGORY_COLORS.get(value))
+
+            if value != name or color != raw_color or len(item) != 2:
+                dirty = True
 
             categories.append(value)
             colors[value] = color
 
     if not categories:
-        categories = list(DEFAULT_CATEGORIES)
-        colors = {c: DEFAULT_CATEGORY_COLORS.get(c, "") for c in categories}
-        save_category_options(options_path, categories, colors)
-        return categories, colors
+        return (*_default_category_options(), True)
 
-    # normalisation persistée
-    save_category_options(options_path, categories, colors)
+    return categories, colors, dirty
+
+
+def load_category_options(options_path: Path) -> tuple[list[str], dict[str, str]]:
+    """Charge les catégories et leurs couleurs depuis qt_options.json.
+
+    Format supporté (actuel):
+      {"categories": [{"name": "Nourriture", "color": "#FFC0CB"}, ...]}
+
+    Migration automatique depuis l'ancien format:
+      {"categories": ["Nourriture", ...]}
+
+    Le fichier n'est réécrit que si la normalisation a modifié son contenu.
+    """
+
+    categories, colors, dirty = _store(str(options_path)).snapshot()
+    if dirty:
+        save_category_options(options_path, categories, colors)
     return categories, colors
 
 
+def _category_payload(categories: list[str], colors: dict[str, str]) -> dict:
+    return {
+        "categories": [{"name": name, "color": colors.get(name, "")} for name in categories]
+    }
+
+
+def _is_normalized(categories: list[str], colors: dict[str, str]) -> bool:
+    """True si (categories, colors normalisées) se relirait sans aucune correction."""
+
+    if not categories or len({name.casefold() for name in categories}) != len(categories):
+        return False
+    for name in categories:
+        if not name or name != name.strip():
+            return False
+        if not colors[name] and _normalize_hex_color(DEFAULT_CATEGORY_COLORS.get(name)):
+            return False
+    return True
+
+
 def save_category_options(
     options_path: Path, categories: list[str], colors: dict[str, str]
 ) -> None:
-    options_path = Path(options_path)
-    options_path.parent.mkdir(parents=True, exist_ok=True)
-
-    payload = {
-        "categories": [
-            {"name": name, "color": _normalize_hex_color(colors.get(name)) or ""}
-            for name in categories
-        ]
-    }
-
-    options_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    _store(str(options_path)).replace(categories, colors)
 
 
 def load_categories(options_path: Path) -> list[str]:
@@ -441,9 +696,15 @@ def load_categories(options_path: Path) -> list[str]:
     return categories
 
 
-def save_categories(options_path: Path, categories: list[str]) -> None:
+def save_categories(
+    options_path: Path,
+    categories: list[str],
+    *,
+    existing_colors: dict[str, str] | None = None,
+) -> None:
     # Compat: conserve les couleurs existantes si possible
-    existing_categories, existing_colors = load_category_options(options_path)
+    if existing_colors is None:
+        _existing_categories, existing_colors, _dirty = _store(str(options_path)).snapshot()
     colors: dict[str, str] = {}
     for name in categories:
         if name in existing_colors:
@@ -454,53 +715,214 @@ def save_categories(options_path: Path, categories: list[str]) -> None:
 
 
 def add_category(options_path: Path, name: str) -> list[str]:
-    name = name.strip()
-    if not name:
-        raise ValueError("Le nom de catégorie est obligatoire")
+    return _store(str(options_path)).add(name)
 
-    categories = load_categories(options_path)
-    if any(c.casefold() == name.casefold() for c in categories):
-        raise ValueError("Cette catégorie existe déjà")
 
-    categories.append(name)
-    save_categories(options_path, categories)
-    return categories
+def remove_category(options_path: Path, name: str) -> list[str]:
+    return _store(str(options_path)).remove(name)
 
 
-def remove_category(options_path: Path, name: str) -> list[str]:
-    name = name.strip()
-    if not name:
-        raise ValueError("La catégorie à supprimer est invalide")
+def _read_rows(csv_path: Path) -> list[list[str]]:
+    """Lit toutes les lignes du CSV (même résultat que csv.reader).
 
-    categories = load_categories(options_path)
-    remaining = [c for c in categories if c.casefold() != name.casefold()]
-    if len(remaining) == len(categories):
-        raise ValueError("Catégorie introuvable")
+    Chemin rapide: sans guillemets ni '\\r' isolé, aucune règle d'échappement ne
+    s'applique et un simple split(",") par ligne suffit. Sinon, csv.reader.
+    """
 
-    save_categories(options_path, remaining)
-    return remaining
+    # Lecture binaire puis un seul decode: plus rapide que la couche texte
+    # (newline="" n'y fait aucune traduction, le résultat est identique).
+    with open(csv_path, mode="rb") as file:
+        text = file.read().decode("utf-8")
 
+    if '"' not in text:
+        normalized = text.replace("\r\n", "\n")
+        if "\r" not in normalized:
+            lines = normalized.split("\n")
+            if lines and lines[-1] == "":
+                lines.pop()
+            return [line.split(",") if line else [] for line in lines]
 
-def add_expense(
-    csv_path: Path,
-    *,
-    name: str,
-    date: str,
-    price: str,
-    category: str,
-    description: str,
-    allow_duplicates: bool = False,
-) -> None:
-    """Ajoute une dépense au format: id,name,date,price,category,description."""
+    return list(csv.reader(io.StringIO(text, newline="")))
 
-    csv_path = Path(csv_path)
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    name = name.strip()
-    date = date.strip()
-    price = price.strip()
-    category = category.strip()
-    description = description.strip()
+# Cache des dépenses déjà analysées, à côté du CSV: valable tant que l'empreinte
+# (mtime_ns, taille) du CSV est celle enregistrée. Changer la version invalide tout.
+_EXPENSE_CACHE_VERSION = 1
+_COMPACT_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _expense_cache_path(csv_path: Path) -> Path:
+    return csv_path.with_name(csv_path.name + ".cache.json")
+
+
+def read_expense_cache(csv_path: Path) -> tuple[tuple[int, int] | None, object | None]:
+    """Retourne (empreinte actuelle du CSV, données en cache ou None si périmées).
+
+    L'empreinte est à repasser à write_expense_cache après une analyse complète.
+    """
+
+    csv_path = _as_path(csv_path)
+    stamp = _file_stamp(csv_path)
+    if stamp is None:
+        return None, None
+    try:
+        with open(_expense_cache_path(csv_path), mode="r", encoding="utf-8") as file:
+            payload = json.load(file)
+    except (OSError, ValueError):
+        return stamp, None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != _EXPENSE_CACHE_VERSION
+        or payload.get("stamp") != list(stamp)
+    ):
+        return stamp, None
+    return stamp, payload.get("data")
+
+
+def write_expense_cache(csv_path: Path, stamp: tuple[int, int] | None, data: object) -> None:
+    """Enregistre les données analysées pour l'empreinte lue avant l'analyse (best effort)."""
+
+    if stamp is None:
+        return
+    csv_path = _as_path(csv_path)
+    cache_path = _expense_cache_path(csv_path)
+    payload = {"version": _EXPENSE_CACHE_VERSION, "stamp": list(stamp), "data": data}
+    # Fichier temporaire propre à chaque écriture: deux chargements simultanés ne
+    # peuvent ni mélanger leurs écritures ni publier un fichier à moitié écrit.
+    tmp_path: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=cache_path.parent,
+            prefix=cache_path.name + ".",
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            tmp_path = file.name
+            file.write(_COMPACT_JSON_ENCODER.encode(payload))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def read_expense_rows(csv_path: Path) -> list[list[str]]:
+    """Lignes brutes du CSV des dépenses (liste vide si le fichier n'existe pas)."""
+
+    csv_path = _as_path(csv_path)
+    if not csv_path.exists():
+        return []
+    return _read_rows(csv_path)
+
+
+# Index des doublons par fichier de dépenses: {chemin: ((mtime_ns, taille), clés)}.
+# Une clé est le tuple (name, date, price, category, description).
+_EXPENSE_KEYS_CACHE: dict[str, tuple[tuple[int, int], set[tuple[str, ...]]]] = {}
+
+# Fichiers déjà au format à id, par (chemin, (mtime_ns, taille)): migrate_expense_ids
+# n'a pas besoin de les relire. Toute modification externe change l'empreinte.
+_MIGRATED: set[tuple[str, tuple[int, int]]] = set()
+
+
+def _invalidate_expense_caches(csv_path: Path) -> None:
+    """Oublie l'index des doublons et l'état migré d'un fichier qu'on réécrit.
+
+    L'empreinte seule ne suffit pas: une réécriture sur place à taille égale dans
+    le même tic d'horloge (horodatage grossier sous Windows) la laisse inchangée.
+    """
+
+    key = str(csv_path)
+    _EXPENSE_KEYS_CACHE.pop(key, None)
+    _MIGRATED.difference_update([entry for entry in _MIGRATED if entry[0] == key])
+
+
+def _mark_migrated(csv_path: Path) -> None:
+    """Mémorise que le fichier, dans son état actuel, est au format à id."""
+
+    stamp = _file_stamp(csv_path)
+    if stamp is not None:
+        _MIGRATED.add((str(csv_path), stamp))
+
+
+def _load_expense_keys(csv_path: Path) -> set[tuple[str, ...]]:
+    """Retourne l'ensemble des dépenses existantes (sans l'id) pour la détection de doublons.
+
+    Construit en une seule passe puis mis en cache tant que le fichier ne change pas.
+    """
+
+    stamp = _file_stamp(csv_path)
+    if stamp is None:
+        return set()
+
+    cache_key = str(csv_path)
+    cached = _EXPENSE_KEYS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    keys: set[tuple[str, ...]] = set()
+    for existing in _read_rows(csv_path):
+        if not existing:
+            continue
+        # format attendu: [id, name, date, price, category, description]
+        if len(existing) >= 6:
+            keys.add(tuple(existing[1:6]))
+        # compat ancien format (au cas où)
+        elif len(existing) == 5:
+            keys.add(tuple(existing))
+
+    _EXPENSE_KEYS_CACHE[cache_key] = (stamp, keys)
+    return keys
+
+
+_CSV_SPECIAL_CHARS = frozenset(',"\r\n')
+
+
+def _csv_may_contain(csv_path: Path, details_list: list[list[str]]) -> bool:
+    """Préfiltre de doublons par recherche d'octets, sans parser le CSV.
+
+    Retourne False seulement si aucune des dépenses ne peut être présente dans
+    le fichier. Valable uniquement pour un fichier sans guillemets: chaque ligne
+    y est alors exactement "id,name,date,price,category,description". Au moindre
+    doute (guillemets, champ à échapper, correspondance trouvée), retourne True
+    et l'appelant fait la vérification complète.
+    """
+
+    needles: list[bytes] = []
+    for details in details_list:
+        if any(ch in _CSV_SPECIAL_CHARS for field in details for ch in field):
+            return True
+        needles.append(("," + ",".join(details)).encode("utf-8"))
+
+    with open(csv_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'"') != -1:
+                return True
+            for needle in needles:
+                start = mm.find(needle)
+                while start != -1:
+                    end = start + len(needle)
+                    if end == len(mm) or mm[end:end + 1] in (b"\r", b"\n"):
+                        return True
+                    start = mm.find(needle, start + 1)
+    return False
+
+
+def _validated_details(
+    name: str, date: str, price: str, category: str, description: str
+) -> list[str]:
+    """Valide et normalise les champs d'une dépense: [name, date, price, category, description]."""
+
+    name = (name or "").strip()
+    date = (date or "").strip()
+    price = (price or "").strip()
+    category = (category or "").strip()
+    description = (description or "").strip()
 
     if not name:
         raise ValueError("Le nom est obligatoire")
@@ -516,30 +938,239 @@ def add_expense(
     except ValueError as exc:
         raise ValueError("Prix invalide") from exc
 
+    return [name, date, price, category, description]
+
+
+def _new_id() -> str:
+    """Nouvel id de dépense: 32 caractères hexadécimaux aléatoires (même format que uuid4().hex)."""
+
+    return os.urandom(16).hex()
+
+
+def _encode_row(row: list[str]) -> str:
+    """Encode une ligne exactement comme csv.writer l'écrirait dans le fichier."""
+
+    # Cas courant: aucun champ à échapper, un simple join suffit.
+    line = ",".join(row)
+    if (
+        len(row) > 1
+        and line.count(",") == len(row) - 1
+        and '"' not in line
+        and "\r" not in line
+        and "\n" not in line
+    ):
+        return line + "\r\n"
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(row)
+    return buffer.getvalue()
+
+
+class BatchedExpenseWriter:
+    """Ajoute des lignes à expenses.csv avec une seule ouverture du fichier.
+
+    Les lignes sont encodées dans un tampon mémoire puis envoyées au fichier en
+    un seul appel d'écriture à la fermeture (ou dès que le tampon dépasse
+    buffer_size octets). Avec fsync=True, un seul fsync est fait pour le lot.
+
+        with BatchedExpenseWriter(csv_path) as writer:
+            writer.write(row)
+    """
+
+    def __init__(self, csv_path: Path, *, buffer_size: int = 1 << 20, fsync: bool = False):
+        self._csv_path = _as_path(csv_path)
+        self._buffer_size = buffer_size
+        self._fsync = fsync
+        self._file: io.FileIO | None = None
+        self._buffer: io.StringIO | None = None
+
+    def __enter__(self) -> BatchedExpenseWriter:
+        self._csv_path.parent.mkdir(parents=True, exist_ok=True)
+        # Fichier binaire non bufferisé: chaque _flush() correspond à un seul write().
+        self._file = open(self._csv_path, mode="ab", buffering=0)
+        self._buffer = io.StringIO()
+        return self
+
+    def write(self, row: list[str]) -> None:
+        if self._buffer is None:
+            raise RuntimeError("BatchedExpenseWriter doit être utilisé dans un bloc with")
+        self._buffer.write(_encode_row(row))
+        if self._buffer.tell() >= self._buffer_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        data = memoryview(self._buffer.getvalue().encode("utf-8"))
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        while data:
+            written = self._file.write(data)
+            data = data[written:]
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._file is None:
+            return
+        try:
+            self._flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+            self._file = None
+            self._buffer = None
+
+
+def _append_expenses(
+    csv_path: Path,
+    details_list: list[list[str]],
+    *,
+    allow_duplicates: bool,
+    fsync: bool,
+) -> list[list[str]]:
+    """Ajoute des dépenses déjà validées (sans id) en un seul passage d'écriture.
+
+    Retourne les lignes écrites (avec leur id), dans l'ordre.
+    """
+
+    csv_path = _as_path(csv_path)
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+
     # S'assurer que le fichier est déjà migré (sinon les comparaisons seraient incohérentes)
     migrate_expense_ids(csv_path)
 
-    details = [name, date, price, category, description]
-    row = [uuid.uuid4().hex, *details]
-
-    if csv_path.exists() and not allow_duplicates:
-        with csv_path.open(mode="r", encoding="utf-8", newline="") as file:
-            reader = csv.reader(file)
-            for existing in reader:
-                if not existing:
-                    continue
-                # format attendu: [id, name, date, price, category, description]
-                if len(existing) >= 6 and existing[1:6] == details:
-                    raise DuplicateExpenseError("Cette dépense existe déjà")
-                # compat ancien format (au cas où)
-                if len(existing) == 5 and existing == details:
-                    raise DuplicateExpenseError("Cette dépense existe déjà")
-
-    with csv_path.open(mode="a", encoding="utf-8", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(row)
+    keys: set[tuple[str, ...]] | None = None
+    if not allow_duplicates:
+        batch_keys: set[tuple[str, ...]] = set()
+        for details in details_list:
+            key = tuple(details)
+            if key in batch_keys:
+                raise DuplicateExpenseError("Cette dépense existe déjà")
+            batch_keys.add(key)
+
+        stamp = _file_stamp(csv_path)
+        cached = _EXPENSE_KEYS_CACHE.get(str(csv_path))
+        if stamp is None:
+            keys = set()
+        elif (cached is not None and cached[0] == stamp) or _csv_may_contain(csv_path, details_list):
+            keys = _load_expense_keys(csv_path)
+        # Sinon: le préfiltre garantit l'absence de doublon, inutile de construire l'index.
+
+        if keys is not None and not keys.isdisjoint(batch_keys):
+            raise DuplicateExpenseError("Cette dépense existe déjà")
+
+    rows = [[_new_id(), *details] for details in details_list]
+    with BatchedExpenseWriter(csv_path, fsync=fsync) as writer:
+        for row in rows:
+            writer.write(row)
+
+    # Les lignes ajoutées ont toutes un id: le fichier reste migré.
+    _mark_migrated(csv_path)
+
+    # Garder l'index des doublons synchronisé avec l'ajout (évite une relecture).
+    if keys is not None:
+        keys.update(tuple(details) for details in details_list)
+        stamp = _file_stamp(csv_path)
+        if stamp is not None:
+            _EXPENSE_KEYS_CACHE[str(csv_path)] = (stamp, keys)
 
     backup_expenses_daily(csv_path)
+    return rows
+
+
+def add_expense(
+    csv_path: Path,
+    *,
+    name: str,
+    date: str,
+    price: str,
+    category: str,
+    description: str,
+    allow_duplicates: bool = False,
+) -> list[str]:
+    """Ajoute une dépense au format: id,name,date,price,category,description.
+
+    Retourne la ligne écrite, ce qui évite à l'appelant de relire le CSV.
+    """
+
+    details = _validated_details(name, date, price, category, description)
+    return _append_expenses(
+        csv_path, [details], allow_duplicates=allow_duplicates, fsync=False
+    )[0]
+
+
+def add_expense_many(
+    csv_path: Path,
+    expenses: list[dict[str, str]],
+    *,
+    allow_duplicates: bool = False,
+) -> list[list[str]]:
+    """Ajoute plusieurs dépenses en une seule écriture (import en masse).
+
+    Chaque élément est un dict avec les clés name, date, price, category, description.
+    Tout le lot est validé avant écriture: en cas d'erreur, rien n'est ajouté.
+    Retourne les lignes écrites.
+    """
+
+    details_list = [
+        _validated_details(
+            expense.get("name", ""),
+            expense.get("date", ""),
+            expense.get("price", ""),
+            expense.get("category", ""),
+            expense.get("description", ""),
+        )
+        for expense in expenses
+    ]
+    if not details_list:
+        return []
+    return _append_expenses(
+        csv_path, details_list, allow_duplicates=allow_duplicates, fsync=True
+    )
+
+
+def _rewrite_record(csv_path: Path, expense_id: str, new_row: list[str] | None) -> bool:
+    """Remplace (ou supprime si new_row vaut None) la ligne de l'id donné, sur place.
+
+    Seule la fin du fichier à partir de la ligne concernée est réécrite: modifier
+    une dépense récente ne coûte plus une réécriture complète du CSV.
+    Retourne False si la ligne n'a pas pu être localisée sans analyse complète
+    (l'appelant retombe alors sur la réécriture classique).
+    """
+
+    prefix = (expense_id + ",").encode("utf-8")
+    with open(csv_path, mode="r+b") as file:
+        data = file.read()
+
+        # Début d'enregistrement: début du fichier ou juste après un saut de ligne,
+        # hors d'un champ entre guillemets (nombre pair de '"' avant la position).
+        start = 0 if data.startswith(prefix) else -1
+        pos = 0
+        while start < 0:
+            found = data.find(b"\n" + prefix, pos)
+            if found < 0:
+                return False
+            if data.count(b'"', 0, found) % 2 == 0:
+                start = found + 1
+                break
+            pos = found + 1
+
+        # Fin d'enregistrement: premier saut de ligne hors guillemets.
+        end = len(data)
+        pos = start
+        while True:
+            newline = data.find(b"\n", pos)
+            if newline < 0:
+                break
+            if data.count(b'"', start, newline) % 2 == 0:
+                end = newline + 1
+                break
+            pos = newline + 1
+
+        replacement = b"" if new_row is None else _encode_row(new_row).encode("utf-8")
+        _invalidate_expense_caches(csv_path)
+        file.seek(start)
+        file.write(replacement + data[end:])
+        file.truncate()
+    return True
 
 
 def update_expense(
@@ -548,14 +1179,15 @@ def update_expense(
     expense_id: str,
     new: list[str],
     allow_duplicates: bool = False,
-) -> None:
+) -> list[str]:
     """Met à jour une dépense en remplaçant la ligne identifiée par son id.
 
     Le format attendu pour new est: [name, date, price, category, description].
+    Retourne la ligne écrite (valeurs normalisées).
     """
 
-    csv_path = Path(csv_path)
-    if not csv_path.exists():
+    csv_path = _as_path(csv_path)
+    if not os.path.exists(csv_path):
         raise ValueError("Fichier de dépenses introuvable")
 
     migrate_expense_ids(csv_path)
@@ -567,62 +1199,60 @@ def update_expense(
     if len(new) != 5:
         raise ValueError("Format de dépense invalide")
 
-    name = (new[0] or "").strip()
-    date = (new[1] or "").strip()
-    price = (new[2] or "").strip()
-    category = (new[3] or "").strip()
-    description = (new[4] or "").strip()
-
-    if not name:
-        raise ValueError("Le nom est obligatoire")
-    try:
-        date = normalize_date_text(date)
-    except ValueError as exc:
-        raise ValueError(str(exc)) from exc
-    if not category:
-        raise ValueError("La catégorie est obligatoire")
-    try:
-        # Validation uniquement: on conserve l'expression pour l'édition.
-        _ = parse_price_to_float(price)
-    except ValueError as exc:
-        raise ValueError("Prix invalide") from exc
-
-    new_details = [name, date, price, category, description]
+    new_details = _validated_details(*new)
     new_row = [expense_id, *new_details]
 
-    with csv_path.open(mode="r", encoding="utf-8", newline="") as file:
-        reader = csv.reader(file)
-        rows = [r for r in reader]
-
+    # Chemin rapide: si la nouvelle valeur ne peut pas être un doublon (index en
+    # cache ou préfiltre sur les octets), on remplace la ligne sans parser le CSV.
+    if allow_duplicates:
+        may_duplicate = False
+    else:
+        stamp = _file_stamp(csv_path)
+        cached = _EXPENSE_KEYS_CACHE.get(str(csv_path))
+        if cached is not None and cached[0] == stamp:
+            may_duplicate = tuple(new_details) in cached[1]
+        else:
+            may_duplicate = _csv_may_contain(csv_path, [new_details])
+    if not may_duplicate and _rewrite_record(csv_path, expense_id, new_row):
+        _mark_migrated(csv_path)
+        backup_expenses_daily(csv_path)
+        return new_row
+
+    # Une seule passe: localise la ligne et repère les doublons en même temps.
+    rows: list[list[str]] = []
     idx: int | None = None
-    for i, r in enumerate(rows):
-        if len(r) >= 1 and r[0] == expense_id:
-            idx = i
-            break
+    duplicate = False
+    for r in _read_rows(csv_path):
+        if idx is None and len(r) >= 1 and r[0] == expense_id:
+            idx = len(rows)
+        elif not duplicate and not allow_duplicates and len(r) >= 6 and r[1:6] == new_details:
+            duplicate = True
+        rows.append(r)
+
+    # Id inconnu signalé avant un éventuel doublon.
     if idx is None:
         raise ValueError("Dépense introuvable")
-
-    if not allow_duplicates:
-        for i, r in enumerate(rows):
-            if i == idx:
-                continue
-            if len(r) >= 6 and r[1:6] == new_details:
-                raise DuplicateExpenseError("Cette dépense existe déjà")
+    if duplicate:
+        raise DuplicateExpenseError("Cette dépense existe déjà")
 
     rows[idx] = new_row
 
-    with csv_path.open(mode="w", encoding="utf-8", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerows(rows)
+    if not _rewrite_record(csv_path, expense_id, new_row):
+        _invalidate_expense_caches(csv_path)
+        with csv_path.open(mode="w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerows(rows)
+    _mark_migrated(csv_path)
 
     backup_expenses_daily(csv_path)
+    return new_row
 
 
 def delete_expense(csv_path: Path, *, expense_id: str) -> None:
     """Supprime une dépense par son id."""
 
-    csv_path = Path(csv_path)
-    if not csv_path.exists():
+    csv_path = _as_path(csv_path)
+    if not os.path.exists(csv_path):
         raise ValueError("Fichier de dépenses introuvable")
 
     migrate_expense_ids(csv_path)
@@ -631,9 +1261,12 @@ def delete_expense(csv_path: Path, *, expense_id: str) -> None:
     if not expense_id:
         raise ValueError("Id de dépense invalide")
 
-    with csv_path.open(mode="r", encoding="utf-8", newline="") as file:
-        reader = csv.reader(file)
-        rows = [r for r in reader]
+    if _rewrite_record(csv_path, expense_id, None):
+        _mark_migrated(csv_path)
+        backup_expenses_daily(csv_path)
+        return
+
+    rows = _read_rows(csv_path)
 
     kept: list[list[str]] = []
     removed = False
@@ -646,9 +1279,11 @@ def delete_expense(csv_path: Path, *, expense_id: str) -> None:
     if not removed:
         raise ValueError("Dépense introuvable")
 
+    _invalidate_expense_caches(csv_path)
     with csv_path.open(mode="w", encoding="utf-8", newline="") as file:
         writer = csv.writer(file)
         writer.writerows(kept)
+    _mark_migrated(csv_path)
 
     backup_expenses_daily(csv_path)
 
@@ -662,16 +1297,31 @@ def migrate_expense_ids(csv_path: Path) -> None:
       [id, name, date, price, category, description]
     """
 
-    csv_path = Path(csv_path)
-    if not csv_path.exists():
+    csv_path = _as_path(csv_path)
+    stamp = _file_stamp(csv_path)
+    if stamp is None:
+        return
+    if (str(csv_path), stamp) in _MIGRATED:
         return
 
-    with csv_path.open(mode="r", encoding="utf-8", newline="") as file:
-        reader = csv.reader(file)
-        rows = [r for r in reader]
+    rows = _read_rows(csv_path)
 
-    needs_write = False
+    # Pré-passe: cas courant d'un fichier déjà migré (6 colonnes, ids uniques).
+    # On s'arrête là sans recopier les lignes.
     seen_ids: set[str] = set()
+    for row in rows:
+        if not row:
+            continue
+        expense_id = row[0].strip()
+        if len(row) != 6 or not expense_id or expense_id in seen_ids:
+            break
+        seen_ids.add(expense_id)
+    else:
+        _MIGRATED.add((str(csv_path), stamp))
+        return
+
+    needs_write = False
+    seen_ids.clear()
     new_rows: list[list[str]] = []
 
     for row in rows:
@@ -682,7 +1332,7 @@ def migrate_expense_ids(csv_path: Path) -> None:
         if len(row) >= 6:
             expense_id = (row[0] or "").strip()
             if not expense_id or expense_id in seen_ids:
-                expense_id = uuid.uuid4().hex
+                expense_id = _new_id()
                 needs_write = True
             seen_ids.add(expense_id)
             new_rows.append([expense_id, row[1], row[2], row[3], row[4], row[5]])
@@ -693,14 +1343,14 @@ def migrate_expense_ids(csv_path: Path) -> None:
 
         # Ancien format (5 colonnes)
         if len(row) == 5:
-            expense_id = uuid.uuid4().hex
+            expense_id = _new_id()
             seen_ids.add(expense_id)
             new_rows.append([expense_id, row[0], row[1], row[2], row[3], row[4]])
             needs_write = True
             continue
 
         # Format inattendu: on tente de le garder mais en imposant 6 colonnes
-        expense_id = uuid.uuid4().hex
+        expense_id = _new_id()
         seen_ids.add(expense_id)
         name = (row[0] if len(row) >= 1 else "")
         date = (row[1] if len(row) >= 2 else "")
@@ -711,10 +1361,13 @@ def migrate_expense_ids(csv_path: Path) -> None:
         needs_write = True
 
     if not needs_write:
+        _MIGRATED.add((str(csv_path), stamp))
         return
 
+    _invalidate_expense_caches(csv_path)
     with csv_path.open(mode="w", encoding="utf-8", newline="") as file:
         writer = csv.writer(file)
         writer.writerows(new_rows)
+    _mark_migrated(csv_path)
 
     backup_expenses_daily(csv_path)
@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 
-from typing import Any
+import sys
+from typing import Any, Callable
 
 _LANG = "fr"
 
@@ -78,8 +79,9 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "msg.select_expense": "Sélectionne une dépense dans la liste.",
         "status.filtered": "{visible} / {total} dépenses (filtrées)",
         "status.total": "{total} dépenses",
+        "status.loading": "Chargement…",
         # Tooltips
-        "tt.search": "Filtrer la liste des dépenses.",
+        "tt.search": "Filtrer la liste des dépenses (plusieurs mots: lignes contenant tous les mots).",
         "tt.year": "Filtrer par année.",
         "tt.month": "Filtrer par mois (si une année est sélectionnée).",
         "tt.add": "Ajouter une nouvelle dépense.",
@@ -207,8 +209,9 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "msg.select_expense": "Select an expense in the list.",
         "status.filtered": "{visible} / {total} expenses (filtered)",
         "status.total": "{total} expenses",
+        "status.loading": "Loading…",
         # Tooltips
-        "tt.search": "Filter the expenses list.",
+        "tt.search": "Filter the expenses list (several words: rows containing all of them).",
         "tt.year": "Filter by year.",
         "tt.month": "Filter by month (when a year is selected).",
         "tt.add": "Add a new expense.",
@@ -271,12 +274,34 @@ LANGUAGE_OPTIONS: list[tuple[str, str]] = [
 ]
 
 
+# Clés internées: les clés construites dynamiquement (ex: f"month.{m:02d}") passées
+# par sys.intern() partagent alors l'objet (et le hash) des clés du dictionnaire.
+for _lang, _table in TRANSLATIONS.items():
+    TRANSLATIONS[_lang] = {sys.intern(k): v for k, v in _table.items()}
+del _lang, _table
+
+# Numéros de mois "01".."12" (clés des budgets) et clés de traduction associées,
+# construits une seule fois.
+MONTH_NUMBERS: tuple[str, ...] = tuple(f"{m:02d}" for m in range(1, 13))
+MONTH_KEYS: tuple[str, ...] = tuple(sys.intern("month." + n) for n in MONTH_NUMBERS)
+
+# Dictionnaires utilisés par tr(): langue courante et repli (fr), mis à jour par set_language().
+_CURRENT: dict[str, str] = TRANSLATIONS[_LANG]
+_FALLBACK: dict[str, str] = TRANSLATIONS["fr"]
+
+
+# Fonctions de formatage par clé pour la langue courante (voir tr_formatter).
+_FORMATTERS: dict[str, Callable[..., str]] = {}
+
+
 def set_language(lang: str) -> None:
-    global _LANG
+    global _LANG, _CURRENT
     lang = (lang or "").strip().lower()
     if lang not in TRANSLATIONS:
         lang = "fr"
     _LANG = lang
+    _CURRENT = TRANSLATIONS[lang]
+    _FORMATTERS.clear()
 
 
 def get_language() -> str:
@@ -284,15 +309,38 @@ def get_language() -> str:
 
 
 def tr(key: str, default: str | None = None, /, **fmt: Any) -> str:
-    lang = _LANG if _LANG in TRANSLATIONS else "fr"
-    value = TRANSLATIONS.get(lang, {}).get(key)
-    if value is None:
-        value = TRANSLATIONS.get("fr", {}).get(key)
-    if value is None:
-        value = default if default is not None else key
+    try:
+        value = _CURRENT[key]
+    except KeyError:
+        value = _FALLBACK.get(key)
+        if value is None:
+            value = default if default is not None else key
     if fmt:
         try:
-            return value.format(**fmt)
+            return value.format_map(fmt)
         except Exception:
             return value
     return value
+
+
+def tr_formatter(key: str) -> Callable[..., str]:
+    """Retourne le formateur (str.format lié) du texte traduit de key.
+
+    Pour les gabarits appliqués en boucle (infobulles du pivot): la recherche de
+    la traduction est faite une seule fois, chaque appel ne fait plus que le format.
+    Comme tr(), un gabarit mal formé renvoie le texte brut au lieu de lever.
+    """
+
+    formatter = _FORMATTERS.get(key)
+    if formatter is None:
+        template = tr(key)
+        format_template = template.format
+
+        def formatter(**fmt: Any) -> str:
+            try:
+                return format_template(**fmt)
+            except Exception:
+                return template
+
+        _FORMATTERS[key] = formatter
+    return formatter
@@ -1,22 +1,62 @@
 from __future__ import annotations
 
-import csv
+import bisect
+import functools
+import re
 import shutil
+import sys
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from . import logic
 from .budget_dialog import BudgetDialog
-from .translate import LANGUAGE_OPTIONS, set_language, tr
+from .translate import LANGUAGE_OPTIONS, MONTH_KEYS, MONTH_NUMBERS, set_language, tr, tr_formatter
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
+# Couleurs du pivot, partagées par toutes les cellules et tous les rafraîchissements.
+RED_BRUSH = QtGui.QBrush(QtGui.QColor("#b92020"))
+GREEN_BRUSH = QtGui.QBrush(QtGui.QColor("#008000"))
+# Couleur d'un "reste", indexée par signe + 1: rouge si <0, couleur par défaut si 0, vert si >0.
+REMAINING_BRUSHES = (RED_BRUSH, None, GREEN_BRUSH)
 
-@dataclass(frozen=True)
+
+# "JJ/MM/AAAA" strict (chiffres ASCII uniquement), validé et découpé en un seul appel.
+_DATE_RE = re.compile(r"(\d{2})/(\d{2})/(\d{4})", re.ASCII)
+# Jours maximum par mois (février bissextile vérifié à part).
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def date_key(text: str) -> int:
+	"""Convertit "JJ/MM/AAAA" en entier AAAAMMJJ (ordre chronologique), 0 si invalide.
+
+	Mêmes règles que QDate.fromString(text, "dd/MM/yyyy"), sans appel à Qt.
+	"""
+	match = _DATE_RE.fullmatch(text)
+	if match is None:
+		return 0
+	d, m, y = map(int, match.groups())
+	# QDate n'a pas d'année 0.
+	if not (1 <= m <= 12 and 1 <= d <= _DAYS_IN_MONTH[m]) or not y:
+		return 0
+	if m == 2 and d == 29 and (y % 4 or (y % 100 == 0 and y % 400)):
+		return 0
+	return y * 10000 + m * 100 + d
+
+
+@functools.lru_cache(maxsize=8)
+def sorted_casefold(names: tuple[str, ...]) -> tuple[str, ...]:
+	"""Noms triés sans tenir compte de la casse; mis en cache (les catégories changent rarement)."""
+	return tuple(sorted(names, key=str.casefold))
+
+
+# slots: pas de __dict__ par dépense (~35% de mémoire en moins sur de gros fichiers).
+@dataclass(frozen=True, slots=True)
 class Expense:
 	id: str
 	name: str
@@ -26,78 +66,470 @@ class Expense:
 	description: str
 
 
-class ExpensesProxyModel(QtCore.QSortFilterProxyModel):
+# Colonnes dérivées d'une liste d'Expense: (clés de date, prix affichés, textes de recherche).
+ExpenseColumns = tuple[list[int], list[str], list[str]]
+
+
+def expense_columns(expenses: list[Expense]) -> ExpenseColumns:
+	"""Calcule les colonnes dérivées sans objet graphique (utilisable hors du thread GUI)."""
+	date_keys: list[int] = []
+	price_display: list[str] = []
+	haystacks: list[str] = []
+	# Les mêmes prix reviennent souvent: chaque texte distinct n'est analysé qu'une fois.
+	display_of: dict[str, str] = {}
+	for exp in expenses:
+		# Prix formaté une fois ici, jamais pendant le rendu.
+		price = display_of.get(exp.price)
+		if price is None:
+			try:
+				price = logic.format_price(exp.price)
+			except Exception:
+				# Afficher brut si le prix ne se parse pas, quelle que soit l'erreur
+				price = exp.price
+			display_of[exp.price] = price
+		date_keys.append(date_key(exp.date))
+		price_display.append(price)
+		# Un seul casefold par ligne au chargement, pas à chaque frappe.
+		haystacks.append(
+			"\n".join(
+				(exp.id, exp.name, exp.date, price, exp.category, exp.description)
+			).casefold()
+		)
+	return date_keys, price_display, haystacks
+
+
+# Données du pivot: (catégories des dépenses, entrées par année). Une entrée est
+# (indice du mois 0-11, total du mois, indice de la catégorie dans la première liste),
+# au plus une par mois et par catégorie.
+PivotEntries = tuple[list[str], dict[int, list[tuple[int, float, int]]]]
+
+
+def pivot_entries(expenses: list[Expense]) -> PivotEntries:
+	"""Dates et prix analysés une fois par changement des dépenses, pas à chaque rafraîchissement.
+
+	Les montants sont pré-agrégés par (année, mois, catégorie): un rafraîchissement du
+	pivot ne parcourt que ces totaux, quel que soit le nombre de dépenses.
+	Les catégories sont remplacées par un petit entier (ordre de première apparition).
+	Les dépenses sans date valide ou au prix illisible n'ont pas d'entrée, comme dans
+	le pivot, mais leur catégorie est listée.
+	"""
+	categories: list[str] = []
+	category_index: dict[str, int] = {}
+	# Total par (AAAAMM, indice de catégorie)
+	totals: dict[tuple[int, int], float] = {}
+	# Montant par texte de prix distinct (None = illisible): une seule analyse, et une
+	# seule exception, par texte.
+	value_of: dict[str, float | None] = {}
+	for exp in expenses:
+		cat = (exp.category or "").strip()
+		cat_idx = category_index.get(cat)
+		if cat_idx is None:
+			cat_idx = category_index[cat] = len(categories)
+			categories.append(cat)
+		key = date_key(exp.date)
+		if not key:
+			continue
+		if exp.price in value_of:
+			value = value_of[exp.price]
+		else:
+			try:
+				value = logic.parse_price_to_float(exp.price)
+			except Exception:
+				value = None
+			value_of[exp.price] = value
+		if value is None:
+			continue
+		group = (key // 100, cat_idx)
+		totals[group] = totals.get(group, 0.0) + value
+
+	entries: dict[int, list[tuple[int, float, int]]] = {}
+	for (year_month, cat_idx), total in totals.items():
+		entries.setdefault(year_month // 100, []).append((year_month % 100 - 1, total, cat_idx))
+	return categories, entries
+
+
+class ExpensesTableModel(QtCore.QAbstractTableModel):
+	"""Modèle des dépenses: liste d'Expense, tableaux parallèles précalculés, filtre et tri.
+
+	Les lignes affichées sont une liste d'indices (`_visible`) dans les lignes chargées:
+	filtrer ou trier ne reconstruit que cette liste, sans proxy ni rappel par ligne.
+	"""
+
+	# Clés de traduction des en-têtes et attributs d'Expense, par colonne.
+	_HEADER_KEYS = ("col.id", "col.name", "col.date", "col.price", "col.category", "col.description")
+	_FIELDS = ("id", "name", "date", "price", "category", "description")
+
 	def __init__(self, parent: QtCore.QObject | None = None):
 		super().__init__(parent)
-		self._search_text = ""
-		self._year_filter: int | None = None
-		self._month_filter: int | None = None
-
-	def setSearchText(self, text: str) -> None:
-		self._search_text = (text or "").strip()
-		self.invalidateFilter()
-
-	def setYearMonthFilter(self, year: int | None, month: int | None) -> None:
-		self._year_filter = year
-		self._month_filter = month
-		self.invalidateFilter()
-
-	def filterAcceptsRow(
-		self, source_row: int, source_parent: QtCore.QModelIndex
-	) -> bool:
-		model = self.sourceModel()
-		if model is None:
-			return True
-
-		# Recherche texte sur toutes les colonnes
-		if self._search_text:
-			needle = self._search_text.casefold()
-			matched = False
-			for col in range(model.columnCount()):
-				idx = model.index(source_row, col, source_parent)
-				val = str(idx.data() or "")
-				if needle in val.casefold():
-					matched = True
-					break
-				# continuer
-			if not matched:
-				return False
-
-		# Filtre année/mois basé sur la colonne Date (index 1, format JJ/MM/AAAA)
-		if self._year_filter is not None:
-			# Colonne 2 = Date (Id, Nom, Date, ...)
-			idx = model.index(source_row, 2, source_parent)
-			date_text = str(idx.data() or "")
-			date = QtCore.QDate.fromString(date_text, "dd/MM/yyyy")
-			if not date.isValid():
-				return False
-			if date.year() != self._year_filter:
-				return False
-			if self._month_filter is not None and date.month() != self._month_filter:
-				return False
+		self._rows: list[Expense] = []
+		self._date_keys: list[int] = []
+		self._brushes: list[QtGui.QBrush | None] = []
+		self._price_display: list[str] = []
+		self._haystacks: list[str] = []
+		self._brush_by_category: dict[str, QtGui.QBrush] = {}
+		# Indices (dans _rows) des lignes affichées, dans l'ordre d'affichage.
+		self._visible: list[int] = []
+		# Filtre: mots recherchés (casefold), année et mois (None = tous).
+		self._tokens: tuple[str, ...] = ()
+		self._year: int | None = None
+		self._month: int | None = None
+		# Tri courant (-1 = ordre du fichier).
+		self._sort_column = -1
+		self._sort_order = QtCore.Qt.SortOrder.AscendingOrder
+		# Vrai si des lignes ont été ajoutées sans tri (append_expenses(keep_sorted=False)).
+		self._sort_pending = False
+
+	def set_expenses(
+		self, expenses: list[Expense], columns: ExpenseColumns | None = None
+	) -> None:
+		if columns is None:
+			columns = expense_columns(expenses)
+		date_keys, price_display, haystacks = columns
+		brushes = self._brushes_for(expenses)
+
+		self.beginResetModel()
+		self._rows = list(expenses)
+		self._date_keys = date_keys
+		self._brushes = brushes
+		self._price_display = price_display
+		self._haystacks = haystacks
+		self._visible = self._sorted(self._matching_rows(0, len(self._rows)))
+		self.endResetModel()
+
+	def append_expenses(
+		self,
+		expenses: list[Expense],
+		columns: ExpenseColumns | None = None,
+		keep_sorted: bool = True,
+	) -> None:
+		"""Ajoute des lignes chargées; celles qui passent le filtre sont insérées d'un bloc.
+
+		Avec keep_sorted=False (lots intermédiaires d'un chargement), les lignes restent
+		en fin de liste jusqu'au prochain sort().
+		"""
+		if not expenses:
+			return
+		if columns is None:
+			columns = expense_columns(expenses)
+		date_keys, price_display, haystacks = columns
+		brushes = self._brushes_for(expenses)
+		first = len(self._rows)
+		self._rows.extend(expenses)
+		self._date_keys.extend(date_keys)
+		self._brushes.extend(brushes)
+		self._price_display.extend(price_display)
+		self._haystacks.extend(haystacks)
+
+		new_rows = self._matching_rows(first, len(self._rows))
+		if (
+			len(new_rows) == 1
+			and keep_sorted
+			and self._sort_column >= 0
+			and not self._sort_pending
+		):
+			# Ajout unitaire (nouvelle dépense): insertion directe à sa place triée.
+			position = self._insert_position(new_rows[0])
+			self.beginInsertRows(QtCore.QModelIndex(), position, position)
+			self._visible.insert(position, new_rows[0])
+			self.endInsertRows()
+			return
+		if new_rows:
+			start = len(self._visible)
+			self.beginInsertRows(QtCore.QModelIndex(), start, start + len(new_rows) - 1)
+			self._visible.extend(new_rows)
+			self.endInsertRows()
+		if not keep_sorted:
+			self._sort_pending = self._sort_pending or bool(new_rows)
+		elif new_rows or self._sort_pending:
+			self._resort()
+
+	def _set_brushes(self, category_colors: dict[str, str]) -> None:
+		# Palette validée une fois par changement de couleurs, pas à chaque chargement.
+		self._brush_by_category = {}
+		for category, color_hex in category_colors.items():
+			if not color_hex:
+				continue
+			qcolor = QtGui.QColor(color_hex)
+			if qcolor.isValid():
+				self._brush_by_category[category] = QtGui.QBrush(qcolor)
+
+	def _brushes_for(self, expenses: list[Expense]) -> list[QtGui.QBrush | None]:
+		# Tableau parallèle de pinceaux partagés: data(BackgroundRole) n'est qu'un accès indexé.
+		if not self._brush_by_category:
+			return [None] * len(expenses)
+		brush_for = self._brush_by_category.get
+		return [brush_for(exp.category) for exp in expenses]
+
+	def _matching_rows(self, start: int, stop: int) -> list[int]:
+		"""Indices de [start, stop) qui passent le filtre, dans l'ordre du fichier."""
+		return self._filter_rows(range(start, stop))
+
+	def _filter_rows(self, rows: Iterable[int]) -> list[int]:
+		"""Indices de `rows` qui passent le filtre, dans le même ordre."""
+		# Année/mois en premier: comparaison d'entiers (AAAAMMJJ), bien moins chère
+		# que la recherche texte.
+		if self._year is not None:
+			keys = self._date_keys
+			if self._month is None:
+				year = self._year
+				rows = [i for i in rows if keys[i] // 10000 == year]
+			else:
+				year_month = self._year * 100 + self._month
+				rows = [i for i in rows if keys[i] // 100 == year_month]
+		# Texte de la ligne déjà casefold: un test d'inclusion par mot, chaque passe
+		# ne reprenant que les lignes retenues par la précédente.
+		haystacks = self._haystacks
+		for token in self._tokens:
+			rows = [i for i in rows if token in haystacks[i]]
+		return list(rows)
+
+	def _sort_key(self):
+		"""Clé de tri de la colonne courante, en fonction d'un indice de ligne chargée."""
+		rows = self._rows
+		if self._sort_column == 2:
+			# Date: ordre chronologique (AAAAMMJJ), les dates invalides (0) en premier.
+			date_keys = self._date_keys
+			return lambda i: (date_keys[i], rows[i].date)
+		if self._sort_column == 3:
+			# Prix: même ordre que le texte affiché.
+			return self._price_display.__getitem__
+		field = self._FIELDS[self._sort_column]
+		return lambda i: getattr(rows[i], field)
+
+	def _sorted(self, rows: list[int]) -> list[int]:
+		self._sort_pending = False
+		if self._sort_column < 0:
+			return rows
+		# sorted() est stable, y compris en ordre décroissant.
+		return sorted(
+			rows,
+			key=self._sort_key(),
+			reverse=self._sort_order == QtCore.Qt.SortOrder.DescendingOrder,
+		)
 
-		return True
+	def _insert_position(self, source_row: int) -> int:
+		"""Position d'affichage d'une nouvelle ligne (après ses égales, comme sorted())."""
+		key = self._sort_key()
+		new_key = key(source_row)
+		descending = self._sort_order == QtCore.Qt.SortOrder.DescendingOrder
+		low, high = 0, len(self._visible)
+		while low < high:
+			middle = (low + high) // 2
+			middle_key = key(self._visible[middle])
+			if (new_key > middle_key) if descending else (new_key < middle_key):
+				high = middle
+			else:
+				low = middle + 1
+		return low
+
+	def _resort(self) -> None:
+		"""Re-trie les lignes affichées en conservant sélection et index persistants."""
+		if self._sort_column < 0 or len(self._visible) < 2:
+			self._sort_pending = False
+			return
+		self._set_visible(
+			self._sorted(self._visible),
+			QtCore.QAbstractItemModel.LayoutChangeHint.VerticalSortHint,
+		)
 
-	def lessThan(
+	def _set_visible(
 		self,
-		left: QtCore.QModelIndex,
-		right: QtCore.QModelIndex,
-	) -> bool:
-		# Colonne 1 = Date (format JJ/MM/AAAA). On trie chronologiquement: AAAA/MM/JJ.
-		# Colonne 2 = Date (Id, Nom, Date, ...)
-		if left.column() == 2 and right.column() == 2:
-			left_text = str(left.data() or "")
-			right_text = str(right.data() or "")
-			left_date = QtCore.QDate.fromString(left_text, "dd/MM/yyyy")
-			right_date = QtCore.QDate.fromString(right_text, "dd/MM/yyyy")
+		visible: list[int],
+		hint: QtCore.QAbstractItemModel.LayoutChangeHint = (
+			QtCore.QAbstractItemModel.LayoutChangeHint.NoLayoutChangeHint
+		),
+	) -> None:
+		"""Remplace les lignes affichées par un changement de layout.
+
+		Contrairement à un reset, la vue garde sélection, ligne courante et défilement:
+		les index persistants suivent leur dépense, ou deviennent invalides si elle
+		n'est plus affichée.
+		"""
+		self.layoutAboutToBeChanged.emit([], hint)
+		persistent = self.persistentIndexList()
+		sources = [self._visible[index.row()] for index in persistent]
+		self._visible = visible
+		if persistent:
+			position = {source: row for row, source in enumerate(visible)}
+			invalid = QtCore.QModelIndex()
+			self.changePersistentIndexList(
+				persistent,
+				[
+					self.index(position[source], index.column())
+					if source in position
+					else invalid
+					for source, index in zip(sources, persistent)
+				],
+			)
+		self.layoutChanged.emit([], hint)
+
+	def sort(
+		self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder
+	) -> None:
+		if not 0 <= column < len(self._FIELDS):
+			return
+		self._sort_column = column
+		self._sort_order = order
+		self._resort()
+
+	def set_search_text(self, text: str) -> None:
+		"""Recherche par mots séparés par des espaces: une ligne doit les contenir tous."""
+		# Mots dédoublonnés, les plus longs (souvent les plus sélectifs) en premier.
+		tokens = tuple(sorted(set((text or "").casefold().split()), key=lambda t: (-len(t), t)))
+		self.set_filter(tokens, self._year, self._month)
+
+	def set_year_month(self, year: int | None, month: int | None) -> None:
+		self.set_filter(self._tokens, year, month)
+
+	def set_filter(self, tokens: tuple[str, ...], year: int | None, month: int | None) -> None:
+		"""Applique le filtre (mots casefold, année, mois) sur toutes les lignes chargées."""
+		# Même filtre (ex: espace ajouté en fin de recherche): rien à recalculer.
+		if (tokens, year, month) == (self._tokens, self._year, self._month):
+			return
+		narrowing = not self._sort_pending and self._narrows(tokens, year, month)
+		self._tokens = tokens
+		self._year = year
+		self._month = month
+		if narrowing:
+			# Filtre plus strict (ex: lettre ajoutée à la recherche): seules les lignes
+			# affichées peuvent encore passer, et leur ordre trié reste valable.
+			visible = self._filter_rows(self._visible)
+			if len(visible) == len(self._visible):
+				return
+		else:
+			visible = self._sorted(self._matching_rows(0, len(self._rows)))
+		self._set_visible(visible)
+
+	def _narrows(self, tokens: tuple[str, ...], year: int | None, month: int | None) -> bool:
+		"""Vrai si le nouveau filtre ne peut retenir que des lignes déjà affichées."""
+		if self._year is not None and (
+			year != self._year or (self._month is not None and month != self._month)
+		):
+			return False
+		# Chaque ancien mot doit être contenu dans l'un des nouveaux.
+		return all(any(old in new for new in tokens) for old in self._tokens)
+
+	def total_count(self) -> int:
+		"""Nombre de dépenses chargées, filtrées ou non."""
+		return len(self._rows)
+
+	def expense_at(self, row: int) -> Expense:
+		"""Dépense affichée à la ligne `row` de la vue."""
+		return self._rows[self._visible[row]]
+
+	def _source_row_of(self, expense_id: str) -> int:
+		for row, exp in enumerate(self._rows):
+			if exp.id == expense_id:
+				return row
+		return -1
+
+	def replace_expense(self, expense_id: str, expense: Expense) -> bool:
+		"""Remplace une dépense chargée; False si l'id n'est pas (encore) dans le modèle."""
+		source_row = self._source_row_of(expense_id)
+		if source_row < 0:
+			return False
+		(date_key_value,), (price,), (haystack,) = expense_columns([expense])
+		self._rows[source_row] = expense
+		self._date_keys[source_row] = date_key_value
+		self._brushes[source_row] = self._brush_by_category.get(expense.category)
+		self._price_display[source_row] = price
+		self._haystacks[source_row] = haystack
+
+		try:
+			row = self._visible.index(source_row)
+		except ValueError:
+			row = -1
+		accepted = bool(self._matching_rows(source_row, source_row + 1))
+		if row >= 0 and accepted:
+			self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._FIELDS) - 1))
+			self._resort()
+		elif row >= 0:
+			self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+			del self._visible[row]
+			self.endRemoveRows()
+		elif accepted:
+			position = (
+				self._insert_position(source_row)
+				if self._sort_column >= 0
+				else bisect.bisect(self._visible, source_row)
+			)
+			self.beginInsertRows(QtCore.QModelIndex(), position, position)
+			self._visible.insert(position, source_row)
+			self.endInsertRows()
+		return True
 
-			if left_date.isValid() and right_date.isValid():
-				return left_date < right_date
+	def remove_expense(self, expense_id: str) -> bool:
+		"""Retire une dépense chargée; False si l'id n'est pas (encore) dans le modèle."""
+		source_row = self._source_row_of(expense_id)
+		if source_row < 0:
+			return False
+		try:
+			row = self._visible.index(source_row)
+		except ValueError:
+			row = -1
+		if row >= 0:
+			self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+			del self._visible[row]
+		del self._rows[source_row]
+		del self._date_keys[source_row]
+		del self._brushes[source_row]
+		del self._price_display[source_row]
+		del self._haystacks[source_row]
+		# Les lignes suivantes reculent d'un indice; l'ordre affiché ne change pas.
+		self._visible = [i - 1 if i > source_row else i for i in self._visible]
+		if row >= 0:
+			self.endRemoveRows()
+		return True
+
+	def set_category_colors(self, category_colors: dict[str, str]) -> None:
+		"""Recalcule seulement les pinceaux de fond (les lignes ne changent pas)."""
+		self._set_brushes(category_colors)
+		self._brushes = self._brushes_for(self._rows)
+		if self._visible:
+			self.dataChanged.emit(
+				self.index(0, 0),
+				self.index(len(self._visible) - 1, len(self._FIELDS) - 1),
+				[QtCore.Qt.ItemDataRole.BackgroundRole],
+			)
 
-			# Si une des dates est invalide, on retombe sur le tri texte.
-			return left_text < right_text
+	def retranslate(self) -> None:
+		self.headerDataChanged.emit(QtCore.Qt.Orientation.Horizontal, 0, len(self._FIELDS) - 1)
 
-		return super().lessThan(left, right)
+	def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._visible)
+
+	def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._FIELDS)
+
+	def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+		if not index.isValid():
+			return None
+		row = self._visible[index.row()]
+		col = index.column()
+		if role == QtCore.Qt.ItemDataRole.DisplayRole:
+			if col == 3:
+				return self._price_display[row]
+			return getattr(self._rows[row], self._FIELDS[col])
+		if role == QtCore.Qt.ItemDataRole.EditRole:
+			# Valeurs brutes (prix: expression saisie, pour l'édition).
+			return getattr(self._rows[row], self._FIELDS[col])
+		if role == QtCore.Qt.ItemDataRole.BackgroundRole:
+			return self._brushes[row]
+		return None
+
+	def headerData(
+		self,
+		section: int,
+		orientation: QtCore.Qt.Orientation,
+		role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+	):
+		if (
+			role == QtCore.Qt.ItemDataRole.DisplayRole
+			and orientation == QtCore.Qt.Orientation.Horizontal
+			and 0 <= section < len(self._HEADER_KEYS)
+		):
+			return tr(self._HEADER_KEYS[section])
+		return super().headerData(section, orientation, role)
 
 class AddExpenseDialog(QtWidgets.QDialog):
 	def __init__(
@@ -129,7 +561,7 @@ class AddExpenseDialog(QtWidgets.QDialog):
 
 		self.category_combo = QtWidgets.QComboBox()
 		self.category_combo.setToolTip(tr("tt.fld.category"))
-		items = sorted(categories, key=str.casefold)
+		items = list(sorted_casefold(tuple(categories)))
 		# Si l'élément à éditer utilise une catégorie inconnue, l'ajouter pour pouvoir la sélectionner.
 		if initial and initial.get("category") and initial["category"] not in items:
 			items = [initial["category"].strip()] + items
@@ -177,6 +609,95 @@ class AddExpenseDialog(QtWidgets.QDialog):
 		}
 
 
+class CategoriesModel(QtCore.QAbstractTableModel):
+	"""Catégories (nom, couleur) en tableaux parallèles, toujours triées par nom (casefold)."""
+
+	_HEADER_KEYS = ("dlg.categories.col_name", "dlg.categories.col_color")
+
+	def __init__(
+		self,
+		categories: list[str],
+		colors: dict[str, str],
+		parent: QtCore.QObject | None = None,
+	):
+		super().__init__(parent)
+		self._names: list[str] = sorted(categories, key=str.casefold)
+		self._colors: list[str] = [colors.get(name, "") or "" for name in self._names]
+		# Casefold des noms, pour tester l'existence en O(1).
+		self._names_cf: set[str] = {name.casefold() for name in self._names}
+		self._brushes: dict[str, QtGui.QBrush] = {}
+
+	def names(self) -> list[str]:
+		return list(self._names)
+
+	def colors(self) -> dict[str, str]:
+		return dict(zip(self._names, self._colors))
+
+	def name(self, row: int) -> str:
+		return self._names[row]
+
+	def contains(self, name: str) -> bool:
+		return name.casefold() in self._names_cf
+
+	def add(self, name: str, color_hex: str) -> int:
+		"""Insère la catégorie à sa place dans l'ordre trié et retourne sa ligne."""
+		row = bisect.bisect(self._names, name.casefold(), key=str.casefold)
+		self.beginInsertRows(QtCore.QModelIndex(), row, row)
+		self._names.insert(row, name)
+		self._colors.insert(row, color_hex or "")
+		self._names_cf.add(name.casefold())
+		self.endInsertRows()
+		return row
+
+	def remove(self, row: int) -> None:
+		self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+		self._names_cf.discard(self._names[row].casefold())
+		del self._names[row]
+		del self._colors[row]
+		self.endRemoveRows()
+
+	def set_color(self, row: int, color_hex: str) -> None:
+		self._colors[row] = color_hex
+		index = self.index(row, 1)
+		self.dataChanged.emit(index, index)
+
+	def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._names)
+
+	def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+		return 0 if parent.isValid() else 2
+
+	def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+		if not index.isValid():
+			return None
+		row = index.row()
+		if role == QtCore.Qt.ItemDataRole.DisplayRole:
+			return self._names[row] if index.column() == 0 else self._colors[row]
+		if role == QtCore.Qt.ItemDataRole.BackgroundRole and index.column() == 1:
+			color_hex = self._colors[row]
+			if not color_hex:
+				return None
+			brush = self._brushes.get(color_hex)
+			if brush is None:
+				brush = self._brushes[color_hex] = QtGui.QBrush(QtGui.QColor(color_hex))
+			return brush
+		return None
+
+	def headerData(
+		self,
+		section: int,
+		orientation: QtCore.Qt.Orientation,
+		role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+	):
+		if (
+			role == QtCore.Qt.ItemDataRole.DisplayRole
+			and orientation == QtCore.Qt.Orientation.Horizontal
+			and 0 <= section < len(self._HEADER_KEYS)
+		):
+			return tr(self._HEADER_KEYS[section])
+		return super().headerData(section, orientation, role)
+
+
 class ManageCategoriesDialog(QtWidgets.QDialog):
 	def __init__(
 		self,
@@ -193,10 +714,9 @@ class ManageCategoriesDialog(QtWidgets.QDialog):
 
 		layout = QtWidgets.QVBoxLayout(self)
 
-		self.table = QtWidgets.QTableWidget(0, 2)
-		self.table.setHorizontalHeaderLabels(
-			[tr("dlg.categories.col_name"), tr("dlg.categories.col_color")]
-		)
+		self.model = CategoriesModel(categories, self._colors, self)
+		self.table = QtWidgets.QTableView()
+		self.table.setModel(self.model)
 		self.table.horizontalHeader().setStretchLastSection(True)
 		self.table.verticalHeader().setVisible(False)
 		self.table.setSelectionBehavior(
@@ -206,9 +726,6 @@ class ManageCategoriesDialog(QtWidgets.QDialog):
 		self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
 		layout.addWidget(self.table, stretch=1)
 
-		for name in sorted(categories, key=str.casefold):
-			self._append_row(name, self._colors.get(name, ""))
-
 		actions = QtWidgets.QHBoxLayout()
 		layout.addLayout(actions)
 
@@ -240,48 +757,19 @@ class ManageCategoriesDialog(QtWidgets.QDialog):
 		layout.addWidget(buttons)
 
 	def categories(self) -> list[str]:
-		return sorted(
-			[
-			self.table.item(row, 0).text()
-			for row in range(self.table.rowCount())
-			if self.table.item(row, 0)
-		],
-			key=str.casefold,
-		)
+		return self.model.names()
 
 	def colors(self) -> dict[str, str]:
-		result: dict[str, str] = {}
-		for row in range(self.table.rowCount()):
-			name_item = self.table.item(row, 0)
-			color_item = self.table.item(row, 1)
-			if not name_item:
-				continue
-			name = name_item.text()
-			color = ""
-			if color_item:
-				color = str(color_item.data(QtCore.Qt.ItemDataRole.UserRole) or "")
-			result[name] = color
-		return result
-
-	def _append_row(self, name: str, color_hex: str) -> None:
-		row = self.table.rowCount()
-		self.table.insertRow(row)
-
-		name_item = QtWidgets.QTableWidgetItem(name)
-		self.table.setItem(row, 0, name_item)
-
-		color_item = QtWidgets.QTableWidgetItem(color_hex or "")
-		color_item.setData(QtCore.Qt.ItemDataRole.UserRole, color_hex or "")
-		if color_hex:
-			qcolor = QtGui.QColor(color_hex)
-			color_item.setBackground(QtGui.QBrush(qcolor))
-		self.table.setItem(row, 1, color_item)
+		return self.model.colors()
+
+	def _current_row(self) -> int:
+		return self.table.currentIndex().row()
 
 	def _on_add(self) -> None:
 		name = self.new_category_edit.text().strip()
 		if not name:
 			return
-		if any(c.casefold() == name.casefold() for c in self.categories()):
+		if self.model.contains(name):
 			QtWidgets.QMessageBox.warning(
 				self,
 				tr("dialog.error"),
@@ -296,18 +784,15 @@ class ManageCategoriesDialog(QtWidgets.QDialog):
 		)
 		color_hex = chosen.name() if chosen.isValid() else ""
 		self._colors[name] = color_hex
-		self._append_row(name, color_hex)
-		self.table.sortItems(0, QtCore.Qt.SortOrder.AscendingOrder)
+		# Insertion directe à sa place: la liste reste triée sans re-tri.
+		self.model.add(name, color_hex)
 		self.new_category_edit.clear()
 
 	def _on_pick_color(self) -> None:
-		row = self.table.currentRow()
+		row = self._current_row()
 		if row < 0:
 			return
-		name_item = self.table.item(row, 0)
-		if not name_item:
-			return
-		name = name_item.text()
+		name = self.model.name(row)
 
 		current_hex = self._colors.get(name, "")
 		chosen = QtWidgets.QColorDialog.getColor(
@@ -319,23 +804,13 @@ class ManageCategoriesDialog(QtWidgets.QDialog):
 			return
 		color_hex = chosen.name()
 		self._colors[name] = color_hex
-
-		color_item = self.table.item(row, 1)
-		if not color_item:
-			color_item = QtWidgets.QTableWidgetItem()
-			self.table.setItem(row, 1, color_item)
-		color_item.setText(color_hex)
-		color_item.setData(QtCore.Qt.ItemDataRole.UserRole, color_hex)
-		color_item.setBackground(QtGui.QBrush(QtGui.QColor(color_hex)))
+		self.model.set_color(row, color_hex)
 
 	def _on_remove(self) -> None:
-		row = self.table.currentRow()
+		row = self._current_row()
 		if row < 0:
 			return
-		name_item = self.table.item(row, 0)
-		if not name_item:
-			return
-		name = name_item.text()
+		name = self.model.name(row)
 
 		confirm = QtWidgets.QMessageBox.question(
 			self,
@@ -347,57 +822,192 @@ class ManageCategoriesDialog(QtWidgets.QDialog):
 		if confirm != QtWidgets.QMessageBox.StandardButton.Yes:
 			return
 
-		self.table.removeRow(row)
+		self.model.remove(row)
 		self._colors.pop(name, None)
 
 
-def read_expenses(csv_path: Path) -> list[Expense]:
-	if not csv_path.exists():
-		return []
-
-	expenses: list[Expense] = []
-	with csv_path.open(mode="r", encoding="utf-8", newline="") as file:
-		reader = csv.reader(file)
-		for row in reader:
-			if not row:
-				continue
+class PivotModel(QtCore.QAbstractTableModel):
+	"""Tableau pivot en lecture seule: 12 mois + 2 lignes synthèse, cellules précalculées."""
+
+	ROW_COUNT = 14
+	# Lignes synthèse: valeurs en gras (pas la colonne des libellés).
+	_SUMMARY_ROWS = (12, 13)
+
+	def __init__(self, parent: QtCore.QObject | None = None):
+		super().__init__(parent)
+		self._headers = [tr("window.pivot_month"), tr("window.pivot_total")]
+		self._texts = [[label, ""] for label in MONTH_NUMBERS[:12]]
+		self._texts.append([tr("window.pivot_total_to_date"), ""])
+		self._texts.append([tr("window.pivot_year_projection"), ""])
+		self._tooltips = [["", ""] for _ in range(self.ROW_COUNT)]
+		self._foregrounds: list[list[QtGui.QBrush | None]] = [
+			[None, None] for _ in range(self.ROW_COUNT)
+		]
+		self._bold_font = QtGui.QFont()
+		self._bold_font.setBold(True)
+
+	def set_contents(
+		self,
+		headers: list[str],
+		texts: list[list[str]],
+		tooltips: list[list[str]],
+		foregrounds: list[list[QtGui.QBrush | None]],
+	) -> None:
+		"""Remplace tout le contenu: un seul signal pour la vue (pas un par cellule)."""
+		if len(headers) != len(self._headers):
+			# Catégories ajoutées/retirées: les colonnes changent.
+			self.beginResetModel()
+			self._headers = headers
+			self._texts = texts
+			self._tooltips = tooltips
+			self._foregrounds = foregrounds
+			self.endResetModel()
+			return
+		headers_changed = headers != self._headers
+		self._headers = headers
+		self._texts = texts
+		self._tooltips = tooltips
+		self._foregrounds = foregrounds
+		if headers_changed:
+			self.headerDataChanged.emit(QtCore.Qt.Orientation.Horizontal, 0, len(headers) - 1)
+		self.dataChanged.emit(
+			self.index(0, 0), self.index(self.ROW_COUNT - 1, len(headers) - 1)
+		)
 
-			# Format actuel: [id, name, date, price, category, description]
-			# Ancien format toléré: [name, date, price, category, description]
+	def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+		return 0 if parent.isValid() else self.ROW_COUNT
+
+	def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._headers)
+
+	def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+		if not index.isValid():
+			return None
+		row = index.row()
+		col = index.column()
+		if role == QtCore.Qt.ItemDataRole.DisplayRole:
+			return self._texts[row][col]
+		if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+			return self._tooltips[row][col] or None
+		if role == QtCore.Qt.ItemDataRole.ForegroundRole:
+			return self._foregrounds[row][col]
+		if role == QtCore.Qt.ItemDataRole.FontRole:
+			if row in self._SUMMARY_ROWS and col > 0:
+				return self._bold_font
+		return None
+
+	def headerData(
+		self,
+		section: int,
+		orientation: QtCore.Qt.Orientation,
+		role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+	):
+		if (
+			role == QtCore.Qt.ItemDataRole.DisplayRole
+			and orientation == QtCore.Qt.Orientation.Horizontal
+			and 0 <= section < len(self._headers)
+		):
+			return self._headers[section]
+		return super().headerData(section, orientation, role)
+
+
+def iter_expenses(csv_path: Path) -> Iterator[Expense]:
+	# Lecture en bloc (découpage rapide sans guillemets, sinon csv.reader).
+	for row in logic.read_expense_rows(csv_path):
+		n = len(row)
+		if not n:
+			continue
+
+		# Format actuel: [id, name, date, price, category, description]
+		# Ancien format toléré: [name, date, price, category, description]
+		if n >= 6:
+			expense_id, name, date, price, category, description = row[:6]
+		else:
 			expense_id = ""
-			if len(row) >= 6:
-				expense_id = (row[0] if len(row) >= 1 else "").strip()
-				name = (row[1] if len(row) >= 2 else "").strip()
-				date = (row[2] if len(row) >= 3 else "").strip()
-				price = (row[3] if len(row) >= 4 else "").strip()
-				category = (row[4] if len(row) >= 5 else "").strip()
-				description = (row[5] if len(row) >= 6 else "").strip()
-			else:
-				name = (row[0] if len(row) >= 1 else "").strip()
-				date = (row[1] if len(row) >= 2 else "").strip()
-				price = (row[2] if len(row) >= 3 else "").strip()
-				category = (row[3] if len(row) >= 4 else "").strip()
-				description = (row[4] if len(row) >= 5 else "").strip()
-
-			# Ignorer les lignes incomplètes
-			if not name or not date or not category:
-				continue
+			name, date, price, category, description = (row + ["", "", "", ""])[:5]
+		name = name.strip()
+		date = date.strip()
+		# Peu de catégories distinctes: une seule chaîne partagée par catégorie
+		category = sys.intern(category.strip())
+
+		# Ignorer les lignes incomplètes
+		if not name or not date or not category:
+			continue
+
+		yield Expense(
+			id=expense_id.strip(),
+			name=name,
+			date=date,
+			price=price.strip(),
+			category=category,
+			description=description.strip(),
+		)
 
-			expenses.append(
-				Expense(
-					id=expense_id,
-					name=name,
-					date=date,
-					price=price,
-					category=category,
-					description=description,
-				)
-			)
 
-	return expenses
+def read_expenses(csv_path: Path) -> list[Expense]:
+	return list(iter_expenses(csv_path))
+
+
+def load_expenses_cached(csv_path: Path) -> tuple[list[Expense], ExpenseColumns]:
+	"""Dépenses et colonnes dérivées, depuis le cache si le CSV n'a pas changé."""
+	stamp, cached = logic.read_expense_cache(csv_path)
+	if isinstance(cached, dict):
+		try:
+			expenses = [
+				Expense(expense_id, name, date, price, sys.intern(category), description)
+				for expense_id, name, date, price, category, description in cached["expenses"]
+			]
+			date_keys, price_display, haystacks = cached["columns"]
+		except (KeyError, TypeError, ValueError):
+			pass
+		else:
+			if len(date_keys) == len(price_display) == len(haystacks) == len(expenses):
+				return expenses, (date_keys, price_display, haystacks)
+
+	expenses = read_expenses(csv_path)
+	columns = expense_columns(expenses)
+	logic.write_expense_cache(
+		csv_path,
+		stamp,
+		{
+			"expenses": [
+				[exp.id, exp.name, exp.date, exp.price, exp.category, exp.description]
+				for exp in expenses
+			],
+			"columns": list(columns),
+		},
+	)
+	return expenses, columns
+
+
+class ExpenseLoaderSignals(QtCore.QObject):
+	# (génération, (dépenses, colonnes dérivées)) / (génération, message d'erreur)
+	loaded = QtCore.pyqtSignal(int, object)
+	failed = QtCore.pyqtSignal(int, str)
+
+
+class ExpenseLoader(QtCore.QRunnable):
+	"""Lit et prépare les dépenses dans un thread du pool, résultat renvoyé par signal."""
+
+	def __init__(self, csv_path: Path, generation: int, signals: ExpenseLoaderSignals):
+		super().__init__()
+		self._csv_path = csv_path
+		self._generation = generation
+		self._signals = signals
+
+	def run(self) -> None:
+		try:
+			expenses, columns = load_expenses_cached(self._csv_path)
+		except Exception as exc:
+			self._signals.failed.emit(self._generation, str(exc))
+			return
+		self._signals.loaded.emit(self._generation, (expenses, columns))
 
 
 class ExpensesWindow(QtWidgets.QMainWindow):
+	# Nombre de lignes insérées par passage de la boucle d'événements au chargement.
+	_LOAD_CHUNK = 500
+
 	def __init__(self, data_dir: Path):
 		super().__init__()
 		self._data_dir = Path(data_dir)
@@ -444,15 +1054,34 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		self.search_edit.setClearButtonEnabled(True)
 		self.search_edit.setToolTip(tr("tt.search"))
 		self.search_edit.textChanged.connect(self._on_search_changed)
+		# Regroupe les frappes rapprochées: un seul filtrage après une courte pause.
+		self._search_timer = QtCore.QTimer(self)
+		self._search_timer.setSingleShot(True)
+		self._search_timer.setInterval(150)
+		self._search_timer.timeout.connect(self._apply_search)
 		header_layout.addWidget(self.search_edit, stretch=2)
 
+		# "Tous" puis les années triées, ajustées par différence à chaque chargement.
 		self.year_combo = QtWidgets.QComboBox()
 		self.year_combo.setToolTip(tr("tt.year"))
+		self.year_combo.addItem(tr("filter.all"), None)
 		self.year_combo.currentIndexChanged.connect(self._on_year_month_changed)
 		header_layout.addWidget(self.year_combo)
-
+		# Pivot rafraîchi une fois la sélection stabilisée (ex: défilement au clavier
+		# dans les listes), et seulement si l'année a changé.
+		self._pivot_timer = QtCore.QTimer(self)
+		self._pivot_timer.setSingleShot(True)
+		self._pivot_timer.setInterval(50)
+		self._pivot_timer.timeout.connect(self._refresh_pivot_if_year_changed)
+		# Année affichée par le pivot (-1: pas encore calculé)
+		self._pivot_year: int | None = -1
+
+		# Les mois ne changent jamais: liste construite une seule fois.
 		self.month_combo = QtWidgets.QComboBox()
 		self.month_combo.setToolTip(tr("tt.month"))
+		self.month_combo.addItem(tr("filter.all"), None)
+		for m in range(1, 13):
+			self.month_combo.addItem(MONTH_NUMBERS[m - 1], int(m))
 		self.month_combo.currentIndexChanged.connect(self._on_year_month_changed)
 		header_layout.addWidget(self.month_combo)
 
@@ -513,11 +1142,16 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		)
 		self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
 		self.table.setSortingEnabled(True)
+		# Tailles constantes: aucune mesure du contenu des lignes ni des colonnes.
 		self.table.horizontalHeader().setStretchLastSection(True)
 		self.table.horizontalHeader().setSectionResizeMode(
 			QtWidgets.QHeaderView.ResizeMode.Interactive
 		)
-		self.table.verticalHeader().setVisible(False)
+		self.table.horizontalHeader().setDefaultSectionSize(120)
+		vheader = self.table.verticalHeader()
+		vheader.setVisible(False)
+		vheader.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+		vheader.setDefaultSectionSize(24)
 		root_layout.addWidget(self.table, stretch=1)
 
 		self.summary_layout = QtWidgets.QHBoxLayout()
@@ -530,10 +1164,9 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		pivot_layout.setSpacing(6)
 
 		# Tableau pivot: 12 lignes (mois) + 2 lignes synthèse, colonnes dynamiques = catégories + Total
-		self.pivot_table = QtWidgets.QTableWidget(14, 2)
-		self.pivot_table.setHorizontalHeaderLabels(
-			[tr("window.pivot_month"), tr("window.pivot_total")]
-		)
+		self._pivot_model = PivotModel(self)
+		self.pivot_table = QtWidgets.QTableView()
+		self.pivot_table.setModel(self._pivot_model)
 		self.pivot_table.horizontalHeader().setStretchLastSection(True)
 		self.pivot_table.verticalHeader().setVisible(False)
 		self.pivot_table.setEditTriggers(
@@ -545,13 +1178,6 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		self.pivot_table.setAlternatingRowColors(True)
 		self.pivot_table.setMinimumHeight(280)
 
-		for i in range(12):
-			month_item = QtWidgets.QTableWidgetItem(f"{i + 1:02d}")
-			self.pivot_table.setItem(i, 0, month_item)
-		# 2 lignes de synthèse
-		self.pivot_table.setItem(12, 0, QtWidgets.QTableWidgetItem(tr("window.pivot_total_to_date")))
-		self.pivot_table.setItem(13, 0, QtWidgets.QTableWidgetItem(tr("window.pivot_year_projection")))
-
 		pivot_layout.addWidget(self.pivot_table)
 
 		self.summary_layout.addWidget(self.pivot_group, stretch=1)
@@ -559,21 +1185,10 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		self.status = QtWidgets.QStatusBar()
 		self.setStatusBar(self.status)
 
-		self._source_model = QtGui.QStandardItemModel(0, 6, self)
-		self._source_model.setHorizontalHeaderLabels(
-			[
-				tr("col.id"),
-				tr("col.name"),
-				tr("col.date"),
-				tr("col.price"),
-				tr("col.category"),
-				tr("col.description"),
-			]
-		)
-
-		self._proxy = ExpensesProxyModel(self)
-		self._proxy.setSourceModel(self._source_model)
-		self.table.setModel(self._proxy)
+		# Filtre et tri faits dans le modèle lui-même (pas de QSortFilterProxyModel).
+		self._model = ExpensesTableModel(self)
+		self._model.set_category_colors(self._category_colors)
+		self.table.setModel(self._model)
 		self.table.doubleClicked.connect(self._on_table_double_clicked)
 		self.table.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
 		self.table.customContextMenuRequested.connect(self._on_table_context_menu)
@@ -582,6 +1197,16 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		self.table.sortByColumn(2, QtCore.Qt.SortOrder.AscendingOrder)
 
 		self._expenses_cache: list[Expense] = []
+		# Entrées du pivot dérivées de _expenses_cache (None = à recalculer).
+		self._pivot_entries: PivotEntries | None = None
+		# Incrémenté à chaque rechargement: les résultats d'un chargement périmé sont ignorés.
+		self._load_generation = 0
+		# Vrai tant que le modèle ne contient pas encore toutes les dépenses lues.
+		self._loading = False
+		# Signaux partagés par les chargements en arrière-plan (objet vivant dans le thread GUI).
+		self._loader_signals = ExpenseLoaderSignals(self)
+		self._loader_signals.loaded.connect(self._on_expenses_loaded)
+		self._loader_signals.failed.connect(self._on_expenses_load_failed)
 
 		# Valeurs par défaut: année + mois actuels
 		current = QtCore.QDate.currentDate()
@@ -607,7 +1232,9 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		self.search_edit.setPlaceholderText(tr("window.search_placeholder"))
 		self.search_edit.setToolTip(tr("tt.search"))
 		self.year_combo.setToolTip(tr("tt.year"))
+		self.year_combo.setItemText(0, tr("filter.all"))
 		self.month_combo.setToolTip(tr("tt.month"))
+		self.month_combo.setItemText(0, tr("filter.all"))
 		self.language_combo.setToolTip(tr("tt.language"))
 		self.add_button.setText(tr("window.add_label"))
 		self.add_button.setToolTip(tr("tt.add"))
@@ -624,27 +1251,12 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		self.table.setToolTip(tr("tt.table"))
 		self.pivot_group.setTitle(tr("window.totals_group"))
 
-		self._source_model.setHorizontalHeaderLabels(
-			[
-				tr("col.id"),
-				tr("col.name"),
-				tr("col.date"),
-				tr("col.price"),
-				tr("col.category"),
-				tr("col.description"),
-			]
-		)
-		# Pivot headers (first + last columns) when table is small
-		if self.pivot_table.columnCount() >= 2:
-			headers = self.pivot_table.horizontalHeaderItem(0)
-			if headers is not None:
-				headers.setText(tr("window.pivot_month"))
-			headers2 = self.pivot_table.horizontalHeaderItem(self.pivot_table.columnCount() - 1)
-			if headers2 is not None:
-				headers2.setText(tr("window.pivot_total"))
+		self._model.retranslate()
+		# En-têtes, mois et libellés du pivot (données déjà analysées, pas de relecture)
+		self._update_pivot_totals()
 
 	def _get_month_names(self) -> list[str]:
-		return [tr(f"month.{i:02d}") for i in range(1, 13)]
+		return [tr(key) for key in MONTH_KEYS]
 
 	def _selected_year_or_current(self) -> int:
 		year_data = self.year_combo.currentData() if self.year_combo.count() else None
@@ -692,7 +1304,7 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 
 		values = dlg.get_values()
 		try:
-			logic.add_expense(
+			row = logic.add_expense(
 				self._csv_path,
 				name=values["name"],
 				date=values["date"],
@@ -706,34 +1318,30 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		except ValueError as exc:
 			QtWidgets.QMessageBox.warning(self, tr("dialog.error"), str(exc))
 			return
-		self.reload()
+		if self._loading:
+			self.reload()
+			return
+
+		# Mise à jour incrémentale: pas de relecture du CSV.
+		exp = Expense(*row)
+		self._set_expenses_cache([*self._expenses_cache, exp])
+		self._model.append_expenses([exp])
+		self._on_expenses_edited(exp)
 
 	def _on_table_double_clicked(self, index: QtCore.QModelIndex) -> None:
 		if not index.isValid():
 			return
 
-		source_index = self._proxy.mapToSource(index)
-		row = source_index.row()
-		if row < 0:
-			return
-
-		def _text_at(col: int) -> str:
-			idx = self._source_model.index(row, col)
-			return str(idx.data() or "")
-
+		exp = self._model.expense_at(index.row())
 		old = {
-			"id": _text_at(0),
-			"name": _text_at(1),
-			"date": _text_at(2),
-			"price": "",
-			"category": _text_at(4),
-			"description": _text_at(5),
+			"id": exp.id,
+			"name": exp.name,
+			"date": exp.date,
+			"price": exp.price,
+			"category": exp.category,
+			"description": exp.description,
 		}
 
-		price_idx = self._source_model.index(row, 3)
-		price_raw = price_idx.data(QtCore.Qt.ItemDataRole.UserRole)
-		old["price"] = str(price_raw) if price_raw is not None else _text_at(3)
-
 		dlg = AddExpenseDialog(
 			self._categories,
 			self,
@@ -745,7 +1353,7 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 
 		values = dlg.get_values()
 		try:
-			logic.update_expense(
+			new_row = logic.update_expense(
 				self._csv_path,
 				expense_id=old["id"],
 				new=[
@@ -762,7 +1370,15 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		except ValueError as exc:
 			QtWidgets.QMessageBox.warning(self, tr("dialog.error"), str(exc))
 			return
-		self.reload()
+		updated = Expense(*new_row)
+		if self._loading or not self._model.replace_expense(old["id"], updated):
+			self.reload()
+			return
+
+		self._set_expenses_cache(
+			[updated if cached.id == updated.id else cached for cached in self._expenses_cache]
+		)
+		self._on_expenses_edited(updated)
 
 	def _on_table_context_menu(self, pos: QtCore.QPoint) -> None:
 		# Clic droit sur la table: ajouter/supprimer rapidement.
@@ -800,16 +1416,11 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		if selection is None or not selection.hasSelection():
 			return
 
-		proxy_index = self.table.currentIndex()
-		if not proxy_index.isValid():
-			return
-
-		source_index = self._proxy.mapToSource(proxy_index)
-		row = source_index.row()
-		if row < 0:
+		index = self.table.currentIndex()
+		if not index.isValid():
 			return
 
-		expense_id = str(self._source_model.index(row, 0).data() or "").strip()
+		expense_id = self._model.expense_at(index.row()).id.strip()
 		if not expense_id:
 			QtWidgets.QMessageBox.warning(self, tr("dialog.error"), tr("msg.expense_id_missing"))
 			return
@@ -829,7 +1440,12 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		except ValueError as exc:
 			QtWidgets.QMessageBox.warning(self, tr("dialog.error"), str(exc))
 			return
-		self.reload()
+		if self._loading or not self._model.remove_expense(expense_id):
+			self.reload()
+			return
+
+		self._set_expenses_cache([exp for exp in self._expenses_cache if exp.id != expense_id])
+		self._on_expenses_edited(None)
 
 	def _on_restore_clicked(self) -> None:
 		# Restaurer un backup CSV (ex: YYYY-MM-DD.csv) vers expenses.csv
@@ -884,176 +1500,171 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		new_categories = dlg.categories()
 		try:
 			logic.save_category_options(self._options_path, new_categories, dlg.colors())
+			# Le dialogue fournit déjà les noms triés (casefold): pas de nouveau tri.
 			self._categories, self._category_colors = logic.load_category_options(
 				self._options_path
 			)
-			self._categories = sorted(self._categories, key=str.casefold)
-			self.reload()
+			# Les dépenses ne changent pas: seules les couleurs et le pivot sont à refaire.
+			self._model.set_category_colors(self._category_colors)
+			self._update_pivot_totals()
 		except Exception as exc:
 			QtWidgets.QMessageBox.warning(self, tr("dialog.error"), str(exc))
 
 	def _on_search_changed(self, text: str) -> None:
-		self._proxy.setSearchText(text)
+		self._search_timer.start()
+
+	def _apply_search(self) -> None:
+		self._model.set_search_text(self.search_edit.text())
 		self._update_status()
 
 	def _on_year_month_changed(self) -> None:
+		self._model.set_year_month(*self._resolve_year_month())
+		self._update_status()
+		self._pivot_timer.start()
+
+	def _selected_year(self) -> int | None:
+		year_data = self.year_combo.currentData() if self.year_combo.count() else None
+		return int(year_data) if isinstance(year_data, int) else None
+
+	def _refresh_pivot_if_year_changed(self) -> None:
+		# Le pivot ne dépend que de l'année, pas du mois.
+		if self._selected_year() != self._pivot_year:
+			self._update_pivot_totals()
+
+	def _resolve_year_month(self) -> tuple[int | None, int | None]:
+		"""(année, mois) sélectionnés; sans année, le mois revient à "Tous" et est désactivé."""
 		year_data = self.year_combo.currentData() if self.year_combo.count() else None
 		if year_data is None:
 			if self.month_combo.count():
 				self.month_combo.setCurrentIndex(0)
 			self.month_combo.setEnabled(False)
-			self._proxy.setYearMonthFilter(None, None)
-			self._update_status()
-			self._update_pivot_totals()
-			return
+			return None, None
 
 		self.month_combo.setEnabled(True)
-		year = int(year_data)
 		month_data = self.month_combo.currentData() if self.month_combo.count() else None
 		month = int(month_data) if isinstance(month_data, int) else None
-
-		self._proxy.setYearMonthFilter(year, month)
-		self._update_status()
-		self._update_pivot_totals()
+		return int(year_data), month
 
 	def _update_pivot_totals(self) -> None:
 		"""Met à jour un tableau pivot: 1 ligne/mois, colonnes = catégories + Total."""
-		year_data = self.year_combo.currentData() if self.year_combo.count() else None
-		year: int | None = int(year_data) if isinstance(year_data, int) else None
+		self._pivot_timer.stop()
+		year = self._selected_year()
+		self._pivot_year = year
+		tooltip_cell = tr_formatter("pivot.tooltip.cell")
+		tooltip_total = tr_formatter("pivot.tooltip.total")
+		tooltip_summary = tr_formatter("pivot.tooltip.summary")
+
+		# Dates et prix déjà analysés: un changement d'année ne relit que ses entrées.
+		if self._pivot_entries is None:
+			self._pivot_entries = pivot_entries(self._expenses_cache)
+		expense_categories, entries_by_year = self._pivot_entries
 
 		# Colonnes = toutes les catégories connues + celles présentes dans les dépenses
-		category_set: set[str] = set(self._categories)
-		for exp in self._expenses_cache:
-			cat = (exp.category or "").strip()
-			if cat:
-				category_set.add(cat)
-			else:
-				category_set.add(tr("pivot.uncategorized"))
-		categories = sorted(category_set, key=str.casefold)
+		uncategorized = tr("pivot.uncategorized")
+		expense_labels = [cat or uncategorized for cat in expense_categories]
+		# Tri mis en cache: même liste de catégories d'un rafraîchissement à l'autre.
+		categories = sorted_casefold(tuple(dict.fromkeys([*self._categories, *expense_labels])))
+		column_of = {cat: ci for ci, cat in enumerate(categories)}
+		# Indice de catégorie des dépenses -> indice de colonne du pivot
+		column_for = [column_of[cat] for cat in expense_labels]
 		year_key = str(year) if year is not None else ""
 		budgets_for_year: dict[str, dict[str, float]] = (
 			self._budgets.get(year_key, {}) if year_key else {}
 		)
 		headers = [tr("window.pivot_month"), *categories, tr("window.pivot_total")]
-		self.pivot_table.setColumnCount(len(headers))
-		self.pivot_table.setHorizontalHeaderLabels(headers)
-		self.pivot_table.horizontalHeader().setStretchLastSection(True)
-		self.pivot_table.setRowCount(14)
 
-		# cumuls[month_index][category] = total
-		cumuls: list[dict[str, float]] = [dict() for _ in range(12)]
-		for exp in self._expenses_cache:
-			date = QtCore.QDate.fromString(exp.date, "dd/MM/yyyy")
-			if not date.isValid():
-				continue
-			if year is not None and date.year() != year:
-				continue
-			try:
-				value = float(logic.parse_price_to_float(exp.price))
-			except Exception:
-				continue
-			m = date.month() - 1
-			if not (0 <= m < 12):
-				continue
-			cat = (exp.category or "").strip()
-			if not cat:
-				cat = tr("pivot.uncategorized")
-			cumuls[m][cat] = cumuls[m].get(cat, 0.0) + value
+		if year is not None:
+			entries = entries_by_year.get(year, [])
+		else:
+			entries = [entry for year_entries in entries_by_year.values() for entry in year_entries]
+
+		# cumuls[month_index][column_index] = total (catégorie = indice de colonne, pas de dict)
+		cumuls: list[list[float]] = [[0.0] * len(categories) for _ in range(12)]
+		for m, value, cat_idx in entries:
+			cumuls[m][column_for[cat_idx]] += value
+
+		# Contenu de chaque cellule (texte, infobulle, couleur), remis d'un bloc au modèle.
+		total_col = len(headers) - 1
+		texts = [[""] * len(headers) for _ in range(PivotModel.ROW_COUNT)]
+		tooltips = [[""] * len(headers) for _ in range(PivotModel.ROW_COUNT)]
+		foregrounds: list[list[QtGui.QBrush | None]] = [
+			[None] * len(headers) for _ in range(PivotModel.ROW_COUNT)
+		]
+
+		current = QtCore.QDate.currentDate()
+		is_current_year = year is not None and year == current.year()
+		months_elapsed = current.month() if is_current_year else 12
+		if months_elapsed < 1:
+			months_elapsed = 1
 
+		# Un seul parcours de la grille: cellules du mois et totaux par catégorie des
+		# lignes synthèse (dépenses et budgets), indexés par colonne.
 		annual_total = 0.0
 		monthly_totals: list[float] = [0.0] * 12
+		to_date_by_cat: list[float] = [0.0] * len(categories)
+		annual_by_cat: list[float] = [0.0] * len(categories)
+		to_date_budget_by_cat: list[float] = [0.0] * len(categories)
+		annual_budget_by_cat: list[float] = [0.0] * len(categories)
 		for m in range(12):
-			month_item = self.pivot_table.item(m, 0)
-			if month_item is None:
-				month_item = QtWidgets.QTableWidgetItem(self._month_names[m])
-				self.pivot_table.setItem(m, 0, month_item)
-			else:
-				month_item.setText(self._month_names[m])
+			in_to_date = m < months_elapsed
+			month_budgets = budgets_for_year.get(MONTH_NUMBERS[m]) if year is not None else None
+			if not isinstance(month_budgets, dict):
+				month_budgets = {}
+			row_texts = texts[m]
+			row_tooltips = tooltips[m]
+			row_foregrounds = foregrounds[m]
+			row_texts[0] = self._month_names[m]
 
 			row_total = 0.0
 			month_budget_total = 0.0
 			month_expenses_on_budget_total = 0.0
 			month_has_any_budget = False
 			for ci, cat in enumerate(categories, start=1):
-				val = cumuls[m].get(cat, 0.0)
+				val = cumuls[m][ci - 1]
 				row_total += val
-				cell = self.pivot_table.item(m, ci)
-				if cell is None:
-					cell = QtWidgets.QTableWidgetItem()
-					self.pivot_table.setItem(m, ci, cell)
-				cell.setText(f"{val:.2f}")
-
-				# Budget / reste (tooltip + surbrillance si dépassement)
-				budget = 0.0
-				budget_set = False
-				if year is not None:
-					month_key = f"{m + 1:02d}"
-					month_budgets = budgets_for_year.get(month_key)
-					if isinstance(month_budgets, dict) and cat in month_budgets:
-						budget = float(month_budgets.get(cat) or 0.0)
-						budget_set = True
-				if budget_set:
+				annual_by_cat[ci - 1] += val
+				if in_to_date:
+					to_date_by_cat[ci - 1] += val
+
+				# Budget / reste (tooltip + surbrillance si dépassement).
+				# Budget défini même si valeur = 0 (présence de la clé).
+				if cat in month_budgets:
+					budget = float(month_budgets.get(cat) or 0.0)
+					annual_budget_by_cat[ci - 1] += budget
+					if in_to_date:
+						to_date_budget_by_cat[ci - 1] += budget
 					month_has_any_budget = True
 					month_budget_total += budget
-					month_expenses_on_budget_total += float(val)
-					remaining = budget - float(val)
+					month_expenses_on_budget_total += val
+					remaining = budget - val
 					# Afficher le reste (budget - dépenses)
-					cell.setText(f"{remaining:.2f}")
-					cell.setToolTip(
-						tr(
-							"pivot.tooltip.cell",
-							budget=budget,
-							expenses=float(val),
-							remaining=remaining,
-						)
+					row_texts[ci] = f"{remaining:.2f}"
+					row_tooltips[ci] = tooltip_cell(
+						budget=budget,
+						expenses=val,
+						remaining=remaining,
 					)
-					cell.setBackground(QtGui.QBrush())
-					if remaining < 0:
-						cell.setForeground(QtGui.QBrush(QtGui.QColor("#b92020")))
-					elif remaining > 0:
-						cell.setForeground(QtGui.QBrush(QtGui.QColor("#008000")))
-					else:
-						cell.setForeground(QtGui.QBrush())
+					row_foregrounds[ci] = REMAINING_BRUSHES[(remaining > 0) - (remaining < 0) + 1]
 				else:
-					cell.setToolTip("")
-					cell.setBackground(QtGui.QBrush())
-					cell.setForeground(QtGui.QBrush())
-
-			total_col = len(headers) - 1
-			total_item = self.pivot_table.item(m, total_col)
-			if total_item is None:
-				total_item = QtWidgets.QTableWidgetItem()
-				self.pivot_table.setItem(m, total_col, total_item)
+					row_texts[ci] = f"{val:.2f}"
 
 			# Si au moins un budget existe ce mois, le Total devient "reste total" sur les catégories budgétées.
 			if month_has_any_budget:
 				remaining_total = month_budget_total - month_expenses_on_budget_total
-				total_item.setText(f"{remaining_total:.2f}")
-				total_item.setToolTip(
-					tr(
-						"pivot.tooltip.total",
-						budget=month_budget_total,
-						expenses=month_expenses_on_budget_total,
-						remaining=remaining_total,
-					)
+				row_texts[total_col] = f"{remaining_total:.2f}"
+				row_tooltips[total_col] = tooltip_total(
+					budget=month_budget_total,
+					expenses=month_expenses_on_budget_total,
+					remaining=remaining_total,
 				)
 				# Couleur standard pour le reste: vert si positif, rouge si négatif
-				if remaining_total < 0:
-					total_item.setForeground(QtGui.QBrush(QtGui.QColor("#b92020")))
-				elif remaining_total > 0:
-					total_item.setForeground(QtGui.QBrush(QtGui.QColor("#008000")))
-				else:
-					total_item.setForeground(QtGui.QBrush())
+				row_foregrounds[total_col] = REMAINING_BRUSHES[
+					(remaining_total > 0) - (remaining_total < 0) + 1
+				]
 			else:
-				total_item.setToolTip("")
-				total_item.setText(f"{row_total:.2f}")
+				row_texts[total_col] = f"{row_total:.2f}"
 				# Couleur "dépenses": rouge si >0, vert si <0
-				if row_total > 0:
-					total_item.setForeground(QtGui.QBrush(QtGui.QColor("#b92020")))
-				elif row_total < 0:
-					total_item.setForeground(QtGui.QBrush(QtGui.QColor("#008000")))
-				else:
-					total_item.setForeground(QtGui.QBrush())
+				row_foregrounds[total_col] = REMAINING_BRUSHES[(row_total < 0) - (row_total > 0) + 1]
 
 			annual_total += row_total
 			monthly_totals[m] = row_total
@@ -1062,12 +1673,6 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 		self.pivot_group.setTitle(tr("pivot.group_title", year=label_year))
 
 		# Lignes synthèse
-		current = QtCore.QDate.currentDate()
-		is_current_year = year is not None and year == current.year()
-		months_elapsed = current.month() if is_current_year else 12
-		if months_elapsed < 1:
-			months_elapsed = 1
-
 		total_to_date = sum(monthly_totals[:months_elapsed])
 		# Deuxième ligne: total sur l'année complète (Janvier → Décembre)
 		projection_year_end = annual_total
@@ -1081,190 +1686,124 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 				"pivot.label_to_date_until",
 				month=self._month_names[months_elapsed - 1],
 			)
-		label_proj = tr("pivot.label_year_total")
-
-		label_item_1 = self.pivot_table.item(row_to_date, 0)
-		if label_item_1 is None:
-			label_item_1 = QtWidgets.QTableWidgetItem()
-			self.pivot_table.setItem(row_to_date, 0, label_item_1)
-		label_item_1.setText(label_to_date)
-
-		label_item_2 = self.pivot_table.item(row_proj, 0)
-		if label_item_2 is None:
-			label_item_2 = QtWidgets.QTableWidgetItem()
-			self.pivot_table.setItem(row_proj, 0, label_item_2)
-		label_item_2.setText(label_proj)
-
-		# Totaux par catégorie sur les lignes synthèse
-		to_date_by_cat: dict[str, float] = {c: 0.0 for c in categories}
-		annual_by_cat: dict[str, float] = {c: 0.0 for c in categories}
-		to_date_budget_by_cat: dict[str, float] = {c: 0.0 for c in categories}
-		annual_budget_by_cat: dict[str, float] = {c: 0.0 for c in categories}
+		texts[row_to_date][0] = label_to_date
+		texts[row_proj][0] = tr("pivot.label_year_total")
 
-		# Si on a une année sélectionnée, on peut calculer des restes via budgets.
-		use_budgets_for_totals = year is not None and bool(budgets_for_year)
-		for m in range(12):
-			month_key = f"{m + 1:02d}"
-			month_budgets = budgets_for_year.get(month_key, {}) if use_budgets_for_totals else {}
-			for c in categories:
-				expense_val = float(cumuls[m].get(c, 0.0))
-				annual_by_cat[c] += expense_val
-				if m < months_elapsed:
-					to_date_by_cat[c] += expense_val
-
-				# Budget défini même si valeur = 0 (présence de la clé)
-				if use_budgets_for_totals and isinstance(month_budgets, dict) and c in month_budgets:
-					b = float(month_budgets.get(c) or 0.0)
-					annual_budget_by_cat[c] += b
-					if m < months_elapsed:
-						to_date_budget_by_cat[c] += b
-
-		proj_by_cat = dict(annual_by_cat)
-
-		def _set_summary_cell(row_idx: int, col_idx: int, value: float) -> None:
-			item = self.pivot_table.item(row_idx, col_idx)
-			if item is None:
-				item = QtWidgets.QTableWidgetItem()
-				self.pivot_table.setItem(row_idx, col_idx, item)
-			item.setText(f"{value:.2f}")
-			font = item.font()
-			font.setBold(True)
-			item.setFont(font)
+		def _set_summary_cell(
+			row_idx: int, col_idx: int, value: float, budget: float | None = None, expenses: float = 0.0
+		) -> None:
+			texts[row_idx][col_idx] = f"{value:.2f}"
 			# Pour les totaux "reste": vert si >0, rouge si <0
-			if value > 0:
-				item.setForeground(QtGui.QBrush(QtGui.QColor("#008000")))
-			elif value < 0:
-				item.setForeground(QtGui.QBrush(QtGui.QColor("#b92020")))
-			else:
-				item.setForeground(QtGui.QBrush())
+			foregrounds[row_idx][col_idx] = REMAINING_BRUSHES[(value > 0) - (value < 0) + 1]
+			if budget is not None:
+				tooltips[row_idx][col_idx] = tooltip_summary(budget=budget, expenses=expenses)
 
-		for ci, cat in enumerate(categories, start=1):
+		# Si on a une année sélectionnée, on peut calculer des restes via budgets.
+		use_budgets_for_totals = year is not None and bool(budgets_for_year)
+		for ci in range(1, len(categories) + 1):
 			if use_budgets_for_totals and (
-				annual_budget_by_cat.get(cat, 0.0) != 0.0
-				or (f"{1:02d}" in budgets_for_year)
+				annual_budget_by_cat[ci - 1] != 0.0
+				or (MONTH_NUMBERS[0] in budgets_for_year)
 			):
 				# reste = budget - dépenses
-				to_date_remaining = to_date_budget_by_cat.get(cat, 0.0) - to_date_by_cat.get(cat, 0.0)
-				year_remaining = annual_budget_by_cat.get(cat, 0.0) - annual_by_cat.get(cat, 0.0)
-				_set_summary_cell(row_to_date, ci, to_date_remaining)
-				_set_summary_cell(row_proj, ci, year_remaining)
-				cell_to_date = self.pivot_table.item(row_to_date, ci)
-				cell_year = self.pivot_table.item(row_proj, ci)
-				if cell_to_date:
-					cell_to_date.setToolTip(
-						tr(
-							"pivot.tooltip.summary",
-							budget=to_date_budget_by_cat.get(cat, 0.0),
-							expenses=to_date_by_cat.get(cat, 0.0),
-						)
-					)
-				if cell_year:
-					cell_year.setToolTip(
-						tr(
-							"pivot.tooltip.summary",
-							budget=annual_budget_by_cat.get(cat, 0.0),
-							expenses=annual_by_cat.get(cat, 0.0),
-						)
-					)
+				_set_summary_cell(
+					row_to_date,
+					ci,
+					to_date_budget_by_cat[ci - 1] - to_date_by_cat[ci - 1],
+					to_date_budget_by_cat[ci - 1],
+					to_date_by_cat[ci - 1],
+				)
+				_set_summary_cell(
+					row_proj,
+					ci,
+					annual_budget_by_cat[ci - 1] - annual_by_cat[ci - 1],
+					annual_budget_by_cat[ci - 1],
+					annual_by_cat[ci - 1],
+				)
 			else:
 				# Fallback: afficher les dépenses si pas de budget
-				_set_summary_cell(row_to_date, ci, to_date_by_cat.get(cat, 0.0))
-				_set_summary_cell(row_proj, ci, proj_by_cat.get(cat, 0.0))
+				_set_summary_cell(row_to_date, ci, to_date_by_cat[ci - 1])
+				_set_summary_cell(row_proj, ci, annual_by_cat[ci - 1])
 
 		# Mettre les totaux dans la dernière colonne
-		def _set_summary_total(row_idx: int, value: float) -> None:
-			total_col = len(headers) - 1
-			item = self.pivot_table.item(row_idx, total_col)
-			if item is None:
-				item = QtWidgets.QTableWidgetItem()
-				self.pivot_table.setItem(row_idx, total_col, item)
-			item.setText(f"{value:.2f}")
-			font = item.font()
-			font.setBold(True)
-			item.setFont(font)
-			# Pour les totaux "reste": vert si >0, rouge si <0
-			if value > 0:
-				item.setForeground(QtGui.QBrush(QtGui.QColor("#008000")))
-			elif value < 0:
-				item.setForeground(QtGui.QBrush(QtGui.QColor("#b92020")))
-			else:
-				item.setForeground(QtGui.QBrush())
-
 		if use_budgets_for_totals:
 			# Total reste = budget_total - dépenses_total (sur catégories budgétées)
-			to_date_budget_total = sum(to_date_budget_by_cat.values())
-			year_budget_total = sum(annual_budget_by_cat.values())
-			to_date_remaining_total = to_date_budget_total - total_to_date
-			year_remaining_total = year_budget_total - projection_year_end
-			_set_summary_total(row_to_date, to_date_remaining_total)
-			_set_summary_total(row_proj, year_remaining_total)
-			item1 = self.pivot_table.item(row_to_date, len(headers) - 1)
-			item2 = self.pivot_table.item(row_proj, len(headers) - 1)
-			if item1:
-				item1.setToolTip(
-					tr(
-						"pivot.tooltip.summary",
-						budget=to_date_budget_total,
-						expenses=total_to_date,
-					)
-				)
-			if item2:
-				item2.setToolTip(
-					tr(
-						"pivot.tooltip.summary",
-						budget=year_budget_total,
-						expenses=projection_year_end,
-					)
-				)
+			to_date_budget_total = sum(to_date_budget_by_cat)
+			year_budget_total = sum(annual_budget_by_cat)
+			_set_summary_cell(
+				row_to_date,
+				total_col,
+				to_date_budget_total - total_to_date,
+				to_date_budget_total,
+				total_to_date,
+			)
+			_set_summary_cell(
+				row_proj,
+				total_col,
+				year_budget_total - projection_year_end,
+				year_budget_total,
+				projection_year_end,
+			)
 		else:
-			_set_summary_total(row_to_date, total_to_date)
-			_set_summary_total(row_proj, projection_year_end)
+			_set_summary_cell(row_to_date, total_col, total_to_date)
+			_set_summary_cell(row_proj, total_col, projection_year_end)
+
+		self._pivot_model.set_contents(headers, texts, tooltips, foregrounds)
 
 	def _update_status(self) -> None:
-		total_rows = self._source_model.rowCount()
-		visible_rows = self._proxy.rowCount()
+		total_rows = self._model.total_count()
+		visible_rows = self._model.rowCount()
 		if self.search_edit.text().strip():
 			self.status.showMessage(tr("status.filtered", visible=visible_rows, total=total_rows))
 		else:
 			self.status.showMessage(tr("status.total", total=total_rows))
 
 	def reload(self) -> None:
-		self._source_model.removeRows(0, self._source_model.rowCount())
 		# Migration automatique: ajoute un id unique à chaque ligne si nécessaire.
 		try:
 			logic.migrate_expense_ids(self._csv_path)
 		except Exception as exc:
+			self._load_generation += 1
+			self._loading = False
+			self._model.set_expenses([])
 			QtWidgets.QMessageBox.warning(self, tr("dialog.error"), str(exc))
 			return
 
-		expenses = read_expenses(self._csv_path)
-		self._expenses_cache = list(expenses)
+		# Lecture et préparation dans le pool de threads: l'interface reste réactive.
+		self._load_generation += 1
+		self._loading = True
+		self.status.showMessage(tr("status.loading"))
+		QtCore.QThreadPool.globalInstance().start(
+			ExpenseLoader(self._csv_path, self._load_generation, self._loader_signals)
+		)
+
+	def _on_expenses_load_failed(self, generation: int, message: str) -> None:
+		if generation != self._load_generation:
+			return
+		self._loading = False
+		self._model.set_expenses([])
+		self._update_status()
+		QtWidgets.QMessageBox.warning(self, tr("dialog.error"), message)
+
+	def _on_expenses_loaded(
+		self, generation: int, payload: tuple[list[Expense], ExpenseColumns]
+	) -> None:
+		if generation != self._load_generation:
+			return
+		expenses, columns = payload
+		self._set_expenses_cache(expenses)
 		# Mettre à jour les filtres année/mois à partir des dates existantes
-		years: set[int] = set()
-		for exp in expenses:
-			date = QtCore.QDate.fromString(exp.date, "dd/MM/yyyy")
-			if date.isValid():
-				years.add(date.year())
+		years: set[int] = {key // 10000 for key in columns[0] if key}
 
 		years.add(self._default_year)
 		sorted_years = sorted(years)
-		previous_year = self.year_combo.currentText() if self.year_combo.count() else ""
-		previous_month = self.month_combo.currentText() if self.month_combo.count() else ""
 
 		self.year_combo.blockSignals(True)
 		self.month_combo.blockSignals(True)
-		self.year_combo.clear()
-		self.year_combo.addItem(tr("filter.all"), None)
-		for y in sorted_years:
-			self.year_combo.addItem(str(y), int(y))
-
-		self.month_combo.clear()
-		self.month_combo.addItem(tr("filter.all"), None)
-		for m in range(1, 13):
-			self.month_combo.addItem(f"{m:02d}", int(m))
+		self._sync_year_items(sorted_years)
 
-		# Défaut: année+mois actuels si disponibles, sinon restaurer la sélection.
-		if str(self._default_year) in [str(y) for y in sorted_years]:
+		# Défaut: année+mois actuels si disponibles, sinon la sélection est conservée.
+		if self._default_year in years:
 			# Choix par data
 			idx_year = self.year_combo.findData(int(self._default_year))
 			if idx_year >= 0:
@@ -1272,55 +1811,92 @@ class ExpensesWindow(QtWidgets.QMainWindow):
 			idx_month = self.month_combo.findData(int(self._default_month))
 			if idx_month >= 0:
 				self.month_combo.setCurrentIndex(idx_month)
-		else:
-			if previous_year:
-				self.year_combo.setCurrentText(previous_year)
-			if previous_month:
-				self.month_combo.setCurrentText(previous_month)
 
+		# Filtre appliqué directement (signaux encore bloqués): statut et pivot ne sont
+		# recalculés qu'une fois, après le remplissage du modèle.
+		self._model.set_year_month(*self._resolve_year_month())
 		self.year_combo.blockSignals(False)
 		self.month_combo.blockSignals(False)
-		self._on_year_month_changed()
-		for exp in expenses:
-			row_color = self._category_colors.get(exp.category, "")
-			brush: QtGui.QBrush | None = None
-			if row_color:
-				qcolor = QtGui.QColor(row_color)
-				if qcolor.isValid():
-					brush = QtGui.QBrush(qcolor)
-			price_display = exp.price
-			try:
-				price_display = logic.format_price(exp.price)
-			except Exception:
-				# Afficher brut si le prix ne se parse pas
-				price_display = exp.price
-
-			id_item = QtGui.QStandardItem(exp.id)
-			name_item = QtGui.QStandardItem(exp.name)
-			date_item = QtGui.QStandardItem(exp.date)
-			price_item = QtGui.QStandardItem(price_display)
-			# Conserver l'expression brute pour l'édition.
-			price_item.setData(exp.price, QtCore.Qt.ItemDataRole.UserRole)
-			category_item = QtGui.QStandardItem(exp.category)
-			description_item = QtGui.QStandardItem(exp.description)
-
-			items = [
-				id_item,
-				name_item,
-				date_item,
-				price_item,
-				category_item,
-				description_item,
-			]
-			for item in items:
-				item.setEditable(False)
-				if brush is not None:
-					item.setBackground(brush)
-			self._source_model.appendRow(items)
+		# Premier lot tout de suite, le reste par lots entre deux passages de la boucle
+		# d'événements pour que la saisie et le défilement restent fluides.
+		chunk = self._LOAD_CHUNK
+		self._model.set_expenses(
+			expenses[:chunk], tuple(column[:chunk] for column in columns)
+		)
+		if len(expenses) > chunk:
+			self._schedule_load_chunk(generation, expenses, columns, chunk)
+		else:
+			self._loading = False
 
 		self._update_status()
 		self._update_pivot_totals()
 
+	def _schedule_load_chunk(
+		self, generation: int, expenses: list[Expense], columns: ExpenseColumns, start: int
+	) -> None:
+		QtCore.QTimer.singleShot(
+			0, lambda: self._load_chunk(generation, expenses, columns, start)
+		)
+
+	def _load_chunk(
+		self, generation: int, expenses: list[Expense], columns: ExpenseColumns, start: int
+	) -> None:
+		if generation != self._load_generation:
+			return
+		end = start + self._LOAD_CHUNK
+		last = end >= len(expenses)
+		# Pas de re-tri à chaque lot: un seul tri, avec le dernier lot.
+		self._model.append_expenses(
+			expenses[start:end], tuple(column[start:end] for column in columns), keep_sorted=last
+		)
+		self._update_status()
+		if last:
+			self._loading = False
+		else:
+			self._schedule_load_chunk(generation, expenses, columns, end)
+
+	def _set_expenses_cache(self, expenses: list[Expense]) -> None:
+		self._expenses_cache = expenses
+		self._pivot_entries = None
+
+	def _on_expenses_edited(self, expense: Expense | None) -> None:
+		"""Rafraîchit filtres, statut et pivot après un ajout/modification/suppression."""
+		if expense is not None:
+			key = date_key(expense.date)
+			if key:
+				self._ensure_year_in_filter(key // 10000)
+		self._update_status()
+		self._update_pivot_totals()
+
+	def _sync_year_items(self, years: list[int]) -> None:
+		"""Aligne les années du filtre sur years: seules les différences sont appliquées."""
+		current = self.year_combo.currentData()
+		wanted = set(years)
+		present: set[int] = set()
+		for index in range(self.year_combo.count() - 1, 0, -1):
+			year = self.year_combo.itemData(index)
+			if year in wanted:
+				present.add(year)
+			else:
+				self.year_combo.removeItem(index)
+		for year in years:
+			if year not in present:
+				self._ensure_year_in_filter(year)
+		# Année sélectionnée disparue: retour sur "Tous".
+		if current is not None and self.year_combo.findData(current) < 0:
+			self.year_combo.setCurrentIndex(0)
+
+	def _ensure_year_in_filter(self, year: int) -> None:
+		if self.year_combo.findData(year) >= 0:
+			return
+		# Les années suivent "Tous" (index 0), en ordre croissant.
+		index = 1
+		while index < self.year_combo.count() and self.year_combo.itemData(index) < year:
+			index += 1
+		was_blocked = self.year_combo.blockSignals(True)
+		self.year_combo.insertItem(index, str(year), year)
+		self.year_combo.blockSignals(was_blocked)
+
 
 def main() -> None:
 	app = QtWidgets.QApplication([])
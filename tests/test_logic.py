@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src import logic
+
+
+class ParsePriceTests(unittest.TestCase):
+    def test_expression(self):
+        self.assertEqual(logic.parse_price_to_float("4+5*6"), 34.0)
+        self.assertEqual(logic.parse_price_to_float("-(1,5+0.5)*2"), -4.0)
+
+    def test_leading_zero_integer_rejected(self):
+        # Même règle que les littéraux Python (ancienne analyse via ast).
+        with self.assertRaises(ValueError):
+            logic.parse_price_to_float("05+1")
+        self.assertEqual(logic.parse_price_to_float("00+1"), 1.0)
+        self.assertEqual(logic.parse_price_to_float("05.5+1"), 6.5)
+
+    def test_malformed_expression_with_zero_division(self):
+        # Expression invalide: ValueError, même si elle contient une division par zéro.
+        for text in ("1/0+", "(1/0", "2*(3/0))"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                logic.parse_price_to_float(text)
+        with self.assertRaises(ZeroDivisionError):
+            logic.parse_price_to_float("1/(2-2)")
+
+    def test_deep_nesting_rejected(self):
+        # Imbrication bornée: ValueError, jamais RecursionError.
+        self.assertEqual(logic.parse_price_to_float("(" * 100 + "1" + ")" * 100), 1.0)
+        for text in (
+            "(" * 101 + "1" + ")" * 101,
+            "(" * 300 + "1" + ")" * 300,
+            "(" * 1000 + "1" + ")" * 1000,
+            "-" * 1000 + "1",
+            "-" * 1000 + "1_0",
+        ):
+            with self.subTest(size=len(text)), self.assertRaises(ValueError):
+                logic.parse_price_to_float(text)
+
+
+class UpdateExpenseTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.csv_path = Path(tmp.name) / "expenses.csv"
+        self.first = logic.add_expense(
+            self.csv_path, name="a", date="01/01/2024", price="1", category="c", description=""
+        )
+        self.second = logic.add_expense(
+            self.csv_path, name="b", date="01/01/2024", price="1", category="c", description=""
+        )
+
+    def test_unknown_id_reported_before_duplicate(self):
+        with self.assertRaisesRegex(ValueError, "introuvable") as ctx:
+            logic.update_expense(
+                self.csv_path, expense_id="inconnu", new=["a", "01/01/2024", "1", "c", ""]
+            )
+        self.assertNotIsInstance(ctx.exception, logic.DuplicateExpenseError)
+
+    def test_duplicate_rejected(self):
+        with self.assertRaises(logic.DuplicateExpenseError):
+            logic.update_expense(
+                self.csv_path, expense_id=self.second[0], new=["a", "01/01/2024", "1", "c", ""]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()